@@ -1,18 +1,27 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, Body, Path
-from fastapi.responses import JSONResponse
-from datetime import datetime
-import json
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, Body, Path, Request
+from fastapi.responses import StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
+import asyncio
+import tempfile
 from app.services.document_reader import extract_text_from_document
 from app.services.chunker import chunk_text
-from app.services.obligation_extractor import extract_obligation_from_chunks
+from app.services.obligation_extractor import extract_obligation_from_chunks, iter_obligations_from_chunks
 from app.services.obligation_issue_service import create_issues_for_all_obligations
+from app.services.extraction_cache import fingerprint_stream, get_cached_document, cache_document
 from app.services.obligation_service import (
     store_obligations,
     get_all_obligations,
+    paginate_obligations,
     get_obligation_by_id,
+    dump_obligation,
+    get_obligations_by_ids,
     update_obligation,
     delete_obligation,
-    set_jira_issue_id
+    set_jira_issue_id,
+    set_jira_issue_ids,
+    claim_issue_creation,
+    release_issue_creation
 )
 from app.services.project_management.issue_service import (
     get_all_issues,
@@ -21,9 +30,11 @@ from app.services.project_management.issue_service import (
     update_issue_details,
     delete_issue
 )
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Any, Tuple, Callable, TypeVar
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from app.models.obligation import ObligationUpdate
+from app.core.config import settings
+from app.core.responses import ORJSONResponse
 
 # Define Pydantic models for request validation
 class IssueStatusUpdate(BaseModel):
@@ -40,8 +51,78 @@ class ObligationBulkCreateRequest(BaseModel):
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+# Validators for hot request bodies, built once at import time
+_OBLIGATIONS_DATA_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+_OBLIGATION_IDS_ADAPTER = TypeAdapter(List[str])
+
+# Accepted issue priorities and common variations mapped onto them
+_VALID_PRI = frozenset({"highest", "high", "medium", "low", "lowest"})
+_PRI_MAP = {"higher": "high", "normal": "medium"}
+
+
+def _json_body_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that validate the raw body themselves."""
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+
+async def _validate_body(request: Request, validate_json: Callable[[bytes], T]) -> T:
+    """Validate the raw JSON body directly, skipping FastAPI's intermediate dict parsing."""
+    body = await request.body()
+    try:
+        return validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False), body=body)
+
+# Uploads larger than this are spooled to disk instead of being held in memory
+UPLOAD_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+_SUPPORTED_TYPES = frozenset({
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/docx"
+})
+
+
+async def _ingest_document(
+    request: Request,
+    file: UploadFile
+) -> Tuple[str, List[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
+    """
+    Validate an uploaded document, then extract and chunk its text.
+
+    Returns the document fingerprint, its chunks, and the cached obligations
+    if this exact document was processed before (None otherwise).
+    """
+    if file.content_type not in _SUPPORTED_TYPES:
+        raise HTTPException(status_code=400, detail=f"Only PDF and DOCX files are supported. Got: {file.content_type}")
+
+    # Stream the upload into a spooled temp file instead of reading it all into memory
+    with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE) as tmp:
+        # Hash while copying so the upload is read exactly once
+        document_hash = await run_in_threadpool(fingerprint_stream, file.file, tmp)
+        
+        # Re-submitted documents skip parsing and LLM extraction entirely
+        cached = get_cached_document(document_hash)
+        if cached is not None:
+            return document_hash, cached["chunks"], cached["obligations"]
+        
+        tmp.seek(0)
+        # The spooled file can't be pickled, so extraction runs on a worker thread;
+        # large PDFs fan their pages out to the process pool from there
+        pages = await run_in_threadpool(
+            extract_text_from_document, tmp, file.content_type, request.app.state.cpu_pool
+        )
+
+    loop = asyncio.get_running_loop()
+    chunks = await loop.run_in_executor(request.app.state.cpu_pool, chunk_text, pages)
+    return document_hash, chunks, None
+
+
 @router.post("/upload-document")
 async def upload_document(
+    request: Request,
     file: UploadFile = File(...),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page")
@@ -55,63 +136,71 @@ async def upload_document(
     - page_size: Number of obligations per page (max 100)
     """
 
-    # Validate file type
-    supported_types = ["application/pdf", 
-                      "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                      "application/docx"]
+    document_hash, chunks, all_obligations = await _ingest_document(request, file)
+    if all_obligations is None:
+        # Extract all obligations
+        all_obligations = await extract_obligation_from_chunks(chunks)
+        cache_document(document_hash, chunks, all_obligations)
     
-    if file.content_type not in supported_types:
-        raise HTTPException(status_code=400, detail=f"Only PDF and DOCX files are supported. Got: {file.content_type}")
-
-    # Read file bytes (async)
-    contents = await file.read()
-    pages = extract_text_from_document(contents, file.content_type)
-    chunks = chunk_text(pages)
-
-    # Extract all obligations
-    all_obligations = await extract_obligation_from_chunks(chunks)
-    
-    # Add source document info to obligations
-    for result in all_obligations:
-        if "parties" in result:
-            for party in result["parties"]:
-                if "obligations" in party:
-                    for obligation in party["obligations"]:
-                        obligation["source_document"] = file.filename
-    
-    # Store obligations for later use
-    stored_obligations = store_obligations(all_obligations)
-
-    # Calculate pagination
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_obligations = all_obligations[start_idx:end_idx]
+    # Store obligations for later use, recording the source document as each one is built
+    stored_obligations = store_obligations(all_obligations, source_document=file.filename)
 
-    # Calculate total pages
-    total_items = len(all_obligations)
-    total_pages = (total_items + page_size - 1) // page_size
+    # Paginate over the obligations stored from this document; only the requested page is serialized
+    paginated = paginate_obligations(stored_obligations, page, page_size)
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "filename": file.filename,
             "total_chunks": len(chunks),
-            "total_obligations": total_items,
-            "current_page": page,
-            "total_pages": total_pages,
+            "total_obligations": paginated["total"],
+            "current_page": paginated["page"],
+            "total_pages": paginated["total_pages"],
             "page_size": page_size,
-            "obligations": paginated_obligations,
-            "pagination": {
-                "has_next": page < total_pages,
-                "has_previous": page > 1,
-                "next_page": page + 1 if page < total_pages else None,
-                "previous_page": page - 1 if page > 1 else None
-            }
+            "obligations": paginated["obligations"],
+            "pagination": paginated["pagination"]
         }
     )
 
 
+@router.post("/upload-document/stream")
+async def upload_document_stream(
+    request: Request,
+    file: UploadFile = File(...)
+):
+    """
+    Upload a document (PDF or DOCX) and stream extracted obligations as NDJSON.
+
+    Each line is a stored obligation, sent as soon as the chunk it came from
+    has been processed, so clients see results before extraction finishes.
+
+    Parameters:
+    - file: Document file to analyze (PDF or DOCX)
+    """
+
+    document_hash, chunks, cached_obligations = await _ingest_document(request, file)
+
+    async def extracted_results():
+        if cached_obligations is not None:
+            for result in cached_obligations:
+                yield result
+        else:
+            results = []
+            async for result in iter_obligations_from_chunks(chunks):
+                results.append(result)
+                yield result
+            cache_document(document_hash, chunks, results)
+
+    async def generate_obligations():
+        async for result in extracted_results():
+            for obligation in store_obligations([result], source_document=file.filename):
+                yield obligation.model_dump_json() + "\n"
+
+    return StreamingResponse(generate_obligations(), media_type="application/x-ndjson")
+
+
 @router.post("/upload-pdf")
 async def upload_pdf(
+    request: Request,
     file: UploadFile = File(...),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page")
@@ -124,48 +213,47 @@ async def upload_pdf(
     - page: Page number for pagination (starts from 1)
     - page_size: Number of obligations per page (max 100)
     """
-    return await upload_document(file, page, page_size)
+    return await upload_document(request, file, page, page_size)
 
 
-@router.post("/create-issues")
+@router.post("/create-issues", openapi_extra=_json_body_schema(_OBLIGATIONS_DATA_ADAPTER.json_schema()))
 async def create_issues(
-    obligations_data: List[Dict[str, Any]] = Body(...),
+    request: Request,
     project_tool: Optional[str] = Query(None, description="Project management tool to use (e.g., jira)")
 ):
     """
     Create issues in the project management tool for the provided obligations.
     
     Parameters:
-    - obligations_data: List of obligation data dictionaries
+    - obligations_data (body): List of obligation data dictionaries
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        results = await create_issues_for_all_obligations(obligations_data, project_tool)
-        
-        # Count successful and failed issue creations
-        success_count = 0
-        failed_count = 0
-        
-        for result in results:
-            if "issue_response" in result and "error" not in result["issue_response"]:
-                success_count += 1
-            else:
-                failed_count += 1
-        
-        return JSONResponse(
-            {
-                "message": f"Created {success_count} issues in the project management tool",
-                "success_count": success_count,
-                "failed_count": failed_count,
-                "results": results
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating issues: {str(e)}")
+    obligations_data = await _validate_body(request, _OBLIGATIONS_DATA_ADAPTER.validate_json)
+    results = await create_issues_for_all_obligations(obligations_data, project_tool)
+    
+    # Count successful and failed issue creations
+    success_count = 0
+    failed_count = 0
+    
+    for result in results:
+        if "issue_response" in result and "error" not in result["issue_response"]:
+            success_count += 1
+        else:
+            failed_count += 1
+    
+    return ORJSONResponse(
+        {
+            "message": f"Created {success_count} issues in the project management tool",
+            "success_count": success_count,
+            "failed_count": failed_count,
+            "results": results
+        }
+    )
 
 
 @router.post("/upload-and-create-issues")
 async def upload_and_create_issues(
+    request: Request,
     file: UploadFile = File(...),
     project_tool: Optional[str] = Query(None, description="Project management tool to use (e.g., jira)")
 ):
@@ -176,32 +264,14 @@ async def upload_and_create_issues(
     - file: Document file to analyze (PDF or DOCX)
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    # Validate file type
-    supported_types = ["application/pdf", 
-                      "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                      "application/docx"]
+    document_hash, chunks, all_obligations = await _ingest_document(request, file)
+    if all_obligations is None:
+        # Extract all obligations
+        all_obligations = await extract_obligation_from_chunks(chunks)
+        cache_document(document_hash, chunks, all_obligations)
     
-    if file.content_type not in supported_types:
-        raise HTTPException(status_code=400, detail=f"Only PDF and DOCX files are supported. Got: {file.content_type}")
-
-    # Read file bytes (async)
-    contents = await file.read()
-    pages = extract_text_from_document(contents, file.content_type)
-    chunks = chunk_text(pages)
-
-    # Extract all obligations
-    all_obligations = await extract_obligation_from_chunks(chunks)
-    
-    # Add source document info to obligations
-    for result in all_obligations:
-        if "parties" in result:
-            for party in result["parties"]:
-                if "obligations" in party:
-                    for obligation in party["obligations"]:
-                        obligation["source_document"] = file.filename
-    
-    # Store obligations
-    stored_obligations = store_obligations(all_obligations)
+    # Store obligations, recording the source document as each one is built
+    stored_obligations = store_obligations(all_obligations, source_document=file.filename)
     
     # Create issues for all obligations
     results = await create_issues_for_all_obligations(all_obligations, project_tool)
@@ -209,23 +279,23 @@ async def upload_and_create_issues(
     # Count successful and failed issue creations
     success_count = 0
     failed_count = 0
+    created_issue_ids = {}
     
-    for result in results:
+    # Results are produced in the same order the obligations were stored
+    for stored_obligation, result in zip(stored_obligations, results):
         if "issue_response" in result and "error" not in result["issue_response"]:
             success_count += 1
             
-            # Update the stored obligation with the Jira issue ID if available
+            # Collect the Jira issue ID for the stored obligation if available
             if "key" in result["issue_response"]:
-                obligation_id = None
-                if "obligation" in result and "id" in result["obligation"]:
-                    obligation_id = result["obligation"]["id"]
-                
-                if obligation_id:
-                    set_jira_issue_id(obligation_id, result["issue_response"]["key"])
+                created_issue_ids[stored_obligation.id] = result["issue_response"]["key"]
         else:
             failed_count += 1
     
-    return JSONResponse(
+    # Persist all new issue IDs in one write
+    set_jira_issue_ids(created_issue_ids)
+    
+    return ORJSONResponse(
         {
             "filename": file.filename,
             "total_chunks": len(chunks),
@@ -253,21 +323,8 @@ async def list_obligations(
     - page_size: Number of obligations per page (max 100)
     - party_name: Optional filter by party name
     """
-    try:
-        result = get_all_obligations(page, page_size, party_name)
-        
-        # Custom JSON encoder for datetime objects
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return super().default(obj)
-        
-        # Convert result to JSON with custom encoder
-        json_compatible_result = json.loads(json.dumps(result, cls=DateTimeEncoder))
-        return JSONResponse(content=json_compatible_result)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving obligations: {str(e)}")
+    result = get_all_obligations(page, page_size, party_name)
+    return ORJSONResponse(result)
 
 
 @router.get("/obligations/{obligation_id}")
@@ -284,63 +341,41 @@ async def get_obligation(
     if not obligation:
         raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
     
-    # Custom JSON encoder for datetime objects
-    class DateTimeEncoder(json.JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            return super().default(obj)
-    
-    # Convert obligation to JSON with custom encoder
-    json_compatible_result = json.loads(json.dumps(obligation.model_dump(), cls=DateTimeEncoder))
-    return JSONResponse(content=json_compatible_result)
+    return ORJSONResponse(dump_obligation(obligation))
 
 
-@router.put("/obligations/{obligation_id}")
+@router.put("/obligations/{obligation_id}", openapi_extra=_json_body_schema(ObligationUpdate.model_json_schema()))
 async def update_obligation_endpoint(
-    obligation_id: str = Path(..., description="ID of the obligation to update"),
-    update_data: ObligationUpdate = Body(...)
+    request: Request,
+    obligation_id: str = Path(..., description="ID of the obligation to update")
 ):
     """
     Update details of an obligation.
     
     Parameters:
     - obligation_id: ID of the obligation to update
-    - update_data: Updated obligation details
+    - update_data (body): Updated obligation details
     """
-    try:
-        # First, get the current obligation to check if it has a Jira issue
-        current_obligation = get_obligation_by_id(obligation_id)
-        if not current_obligation:
-            raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
-        
-        # If the obligation has a Jira issue and the update includes changing the text, prevent it
-        if current_obligation.jira_issue_id and update_data.obligation_text is not None:
-            if update_data.obligation_text != current_obligation.obligation_text:
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Cannot modify obligation text after a Jira issue has been created"
-                )
-        
-        # Proceed with the update
-        updated_obligation = update_obligation(obligation_id, update_data)
-        if not updated_obligation:
-            raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
-        
-        # Custom JSON encoder for datetime objects
-        class DateTimeEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return super().default(obj)
-        
-        # Convert updated_obligation to JSON with custom encoder
-        json_compatible_result = json.loads(json.dumps(updated_obligation.model_dump(), cls=DateTimeEncoder))
-        return JSONResponse(content=json_compatible_result)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error updating obligation: {str(e)}")
+    update_data = await _validate_body(request, ObligationUpdate.model_validate_json)
+    # First, get the current obligation to check if it has a Jira issue
+    current_obligation = get_obligation_by_id(obligation_id)
+    if not current_obligation:
+        raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
+    
+    # If the obligation has a Jira issue and the update includes changing the text, prevent it
+    if current_obligation.jira_issue_id and update_data.obligation_text is not None:
+        if update_data.obligation_text != current_obligation.obligation_text:
+            raise HTTPException(
+                status_code=400, 
+                detail="Cannot modify obligation text after a Jira issue has been created"
+            )
+    
+    # Proceed with the update
+    updated_obligation = update_obligation(obligation_id, update_data)
+    if not updated_obligation:
+        raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
+    
+    return ORJSONResponse(dump_obligation(updated_obligation))
 
 
 @router.delete("/obligations/{obligation_id}")
@@ -353,15 +388,10 @@ async def delete_obligation_endpoint(
     Parameters:
     - obligation_id: ID of the obligation to delete
     """
-    try:
-        success = delete_obligation(obligation_id)
-        if not success:
-            raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
-        return JSONResponse({"success": True, "message": f"Obligation {obligation_id} successfully deleted"})
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting obligation: {str(e)}")
+    success = delete_obligation(obligation_id)
+    if not success:
+        raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
+    return ORJSONResponse({"success": True, "message": f"Obligation {obligation_id} successfully deleted"})
 
 
 @router.post("/obligations/{obligation_id}/create-issue")
@@ -376,128 +406,163 @@ async def create_issue_for_obligation(
     - obligation_id: ID of the obligation to create an issue for
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        # Get the obligation
-        obligation = get_obligation_by_id(obligation_id)
-        if not obligation:
-            raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
-            
-        # Check if an issue already exists
-        if obligation.jira_issue_id:
-            return JSONResponse({
-                "message": f"Issue already exists for this obligation with ID {obligation.jira_issue_id}",
-                "issue_id": obligation.jira_issue_id
-            })
-            
-        # Create the issue
-        from app.services.obligation_issue_service import create_obligation_issue
+    # Get the obligation
+    obligation = get_obligation_by_id(obligation_id)
+    if not obligation:
+        raise HTTPException(status_code=404, detail=f"Obligation with ID {obligation_id} not found")
         
-        obligation_dict = {
-            "obligation_text": obligation.obligation_text,
-            "section": obligation.section,
-            "deadline": obligation.deadline
-        }
+    # Check if an issue already exists
+    if obligation.jira_issue_id:
+        return ORJSONResponse({
+            "message": f"Issue already exists for this obligation with ID {obligation.jira_issue_id}",
+            "issue_id": obligation.jira_issue_id
+        })
+    
+    # A bulk request may already be creating this obligation's issue
+    if not claim_issue_creation(obligation_id):
+        raise HTTPException(status_code=409, detail="Issue creation already in progress for this obligation")
         
+    # Create the issue
+    from app.services.obligation_issue_service import create_obligation_issue
+    
+    obligation_dict = {
+        "obligation_text": obligation.obligation_text,
+        "section": obligation.section,
+        "deadline": obligation.deadline
+    }
+    
+    try:
         response = await create_obligation_issue(obligation_dict, obligation.party_name, project_tool)
         
         # Update the obligation with the issue ID if successful
         if "key" in response and "error" not in response:
             updated_obligation = set_jira_issue_id(obligation_id, response["key"])
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": True,
                 "message": f"Successfully created issue {response['key']} for obligation {obligation_id}",
                 "issue_id": response["key"],
-                "obligation": updated_obligation.model_dump() if updated_obligation else None
+                "obligation": dump_obligation(updated_obligation) if updated_obligation else None
             })
         else:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "message": "Failed to create issue",
                 "error": response.get("error", "Unknown error")
             })
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating issue for obligation: {str(e)}")
+    finally:
+        release_issue_creation([obligation_id])
 
 
-@router.post("/obligations/create-issues")
+@router.post("/obligations/create-issues", openapi_extra=_json_body_schema(_OBLIGATION_IDS_ADAPTER.json_schema()))
 async def create_issues_for_obligations(
-    obligation_ids: List[str] = Body(..., description="List of obligation IDs to create issues for"),
+    request: Request,
     project_tool: str = Query("jira", description="Project management tool to use (e.g., jira)")
 ):
     """
     Create Jira issues for multiple obligations.
     
     Parameters:
-    - obligation_ids: List of obligation IDs to create issues for
+    - obligation_ids (body): List of obligation IDs to create issues for
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        results = []
-        success_count = 0
-        failed_count = 0
-        
-        from app.services.obligation_issue_service import create_obligation_issue
+    obligation_ids = await _validate_body(request, _OBLIGATION_IDS_ADAPTER.validate_json)
+    from app.services.obligation_issue_service import create_obligation_issue
+    
+    # Fetch all requested obligations at once instead of one lookup per ID
+    obligations_map = get_obligations_by_ids(obligation_ids)
+    created_issue_ids: Dict[str, str] = {}
+    claimed_ids: List[str] = []
+    
+    # Bound concurrent calls to stay within the project management tool's rate limits
+    semaphore = asyncio.Semaphore(settings.JIRA_CONCURRENCY)
+    
+    async def process_obligation(obligation_id: str) -> Dict[str, Any]:
+        # Get the obligation
+        obligation = obligations_map.get(obligation_id)
+        if not obligation:
+            return {
+                "obligation_id": obligation_id,
+                "success": False,
+                "message": f"Obligation with ID {obligation_id} not found"
+            }
+            
+        # Skip if an issue already exists
+        if obligation.jira_issue_id:
+            return {
+                "obligation_id": obligation_id,
+                "success": True,
+                "message": f"Issue already exists with ID {obligation.jira_issue_id}",
+                "issue_id": obligation.jira_issue_id
+            }
         
-        for obligation_id in obligation_ids:
-            # Get the obligation
-            obligation = get_obligation_by_id(obligation_id)
-            if not obligation:
-                results.append({
-                    "obligation_id": obligation_id,
-                    "success": False,
-                    "message": f"Obligation with ID {obligation_id} not found"
-                })
-                failed_count += 1
-                continue
-                
-            # Skip if an issue already exists
-            if obligation.jira_issue_id:
-                results.append({
-                    "obligation_id": obligation_id,
-                    "success": True,
-                    "message": f"Issue already exists with ID {obligation.jira_issue_id}",
-                    "issue_id": obligation.jira_issue_id
-                })
-                success_count += 1
-                continue
-                
-            # Create the issue
-            obligation_dict = {
-                "obligation_text": obligation.obligation_text,
-                "section": obligation.section,
-                "deadline": obligation.deadline
+        # Hold the obligation until its issue ID is saved so overlapping requests don't create another issue
+        if not claim_issue_creation(obligation_id):
+            return {
+                "obligation_id": obligation_id,
+                "success": False,
+                "message": "Issue creation already in progress for this obligation"
             }
+        claimed_ids.append(obligation_id)
             
+        # Create the issue
+        obligation_dict = {
+            "obligation_text": obligation.obligation_text,
+            "section": obligation.section,
+            "deadline": obligation.deadline
+        }
+        
+        async with semaphore:
             response = await create_obligation_issue(obligation_dict, obligation.party_name, project_tool)
-            
-            # Update the obligation with the issue ID if successful
-            if "key" in response and "error" not in response:
-                updated_obligation = set_jira_issue_id(obligation_id, response["key"])
-                results.append({
-                    "obligation_id": obligation_id,
-                    "success": True,
-                    "message": f"Successfully created issue {response['key']}",
-                    "issue_id": response["key"]
-                })
-                success_count += 1
-            else:
-                results.append({
-                    "obligation_id": obligation_id,
-                    "success": False,
-                    "message": "Failed to create issue",
-                    "error": response.get("error", "Unknown error")
-                })
-                failed_count += 1
         
-        return JSONResponse({
-            "success_count": success_count,
-            "failed_count": failed_count,
-            "results": results
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating issues for obligations: {str(e)}")
+        # Update the obligation with the issue ID if successful
+        if "key" in response and "error" not in response:
+            created_issue_ids[obligation_id] = response["key"]
+            return {
+                "obligation_id": obligation_id,
+                "success": True,
+                "message": f"Successfully created issue {response['key']}",
+                "issue_id": response["key"]
+            }
+        return {
+            "obligation_id": obligation_id,
+            "success": False,
+            "message": "Failed to create issue",
+            "error": response.get("error", "Unknown error")
+        }
+    
+    # Process each ID once: concurrent copies would all pass the existing-issue check and create duplicates
+    unique_ids = list(dict.fromkeys(obligation_ids))
+    try:
+        unique_results = await asyncio.gather(
+            *[process_obligation(obligation_id) for obligation_id in unique_ids],
+            return_exceptions=True
+        )
+    finally:
+        # Persist all new issue IDs in one write, even if the request was cancelled partway through
+        try:
+            set_jira_issue_ids(created_issue_ids)
+        finally:
+            release_issue_creation(claimed_ids)
+    
+    # Report unexpected per-obligation failures without failing the whole batch
+    results_by_id = {
+        obligation_id: {
+            "obligation_id": obligation_id,
+            "success": False,
+            "message": "Failed to create issue",
+            "error": str(result)
+        } if isinstance(result, Exception) else result
+        for obligation_id, result in zip(unique_ids, unique_results)
+    }
+    results = [results_by_id[obligation_id] for obligation_id in obligation_ids]
+    success_count = sum(1 for result in results if result["success"])
+    failed_count = len(results) - success_count
+    
+    return ORJSONResponse({
+        "success_count": success_count,
+        "failed_count": failed_count,
+        "results": results
+    })
 
 
 # Issue Management APIs
@@ -512,11 +577,8 @@ async def list_issues(
     Parameters:
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        issues = await get_all_issues(project_tool)
-        return JSONResponse({"issues": issues})
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving issues: {str(e)}")
+    issues = await get_all_issues(project_tool)
+    return ORJSONResponse({"issues": issues})
 
 
 @router.get("/issues/{issue_id}")
@@ -531,15 +593,14 @@ async def get_issue(
     - issue_id: ID of the issue to retrieve
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        issue = await get_issue_details(issue_id, project_tool)
+    issue = await get_issue_details(issue_id, project_tool)
+    
+    if not issue:
+        raise HTTPException(status_code=404, detail=f"Issue {issue_id} not found")
+    if "error" in issue:
+        raise HTTPException(status_code=404, detail=f"Issue not found: {issue['error']}")
         
-        if "error" in issue:
-            raise HTTPException(status_code=404, detail=f"Issue not found: {issue['error']}")
-            
-        return JSONResponse(issue)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving issue: {str(e)}")
+    return ORJSONResponse(issue)
 
 
 @router.patch("/issues/{issue_id}/status")
@@ -556,18 +617,17 @@ async def update_status(
     - status_update: New status information
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        result = await update_issue_status(issue_id, status_update.status, project_tool)
+    result = await update_issue_status(issue_id, status_update.status, project_tool)
+    
+    if not result:
+        raise HTTPException(status_code=404, detail=f"Issue {issue_id} not found")
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=f"Failed to update issue status: {result['error']}")
         
-        if "error" in result:
-            raise HTTPException(status_code=400, detail=f"Failed to update issue status: {result['error']}")
-            
-        return JSONResponse({
-            "message": f"Successfully updated status of issue {issue_id}",
-            "issue": result
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error updating issue status: {str(e)}")
+    return ORJSONResponse({
+        "message": f"Successfully updated status of issue {issue_id}",
+        "issue": result
+    })
 
 
 @router.put("/issues/{issue_id}")
@@ -584,40 +644,36 @@ async def update_issue(
     - issue_update: Updated issue details
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        # Convert Pydantic model to dict, excluding None values
-        update_data = {k: v for k, v in issue_update.dict().items() if v is not None}
-        
-        if not update_data:
-            raise HTTPException(status_code=400, detail="No update data provided")
-        
-        # Validate priority if provided
-        if "priority" in update_data:
-            valid_priorities = ["highest", "high", "medium", "low", "lowest"]
-            if update_data["priority"].lower() not in valid_priorities:
-                # Map common variations
-                priority_map = {"higher": "high", "normal": "medium"}
-                update_data["priority"] = priority_map.get(update_data["priority"].lower(), "medium")
+    # Convert Pydantic model to dict, excluding None values
+    update_data = issue_update.model_dump(exclude_none=True)
+    
+    if not update_data:
+        raise HTTPException(status_code=400, detail="No update data provided")
+    
+    # Validate priority if provided
+    if "priority" in update_data:
+        priority = update_data["priority"].lower()
+        update_data["priority"] = priority if priority in _VALID_PRI else _PRI_MAP.get(priority, "medium")
+    
+    # Remove assignee field completely as requested
+    if "assignee" in update_data:
+        del update_data["assignee"]
         
-        # Remove assignee field completely as requested
-        if "assignee" in update_data:
-            del update_data["assignee"]
-            
-        result = await update_issue_details(issue_id, update_data, project_tool)
+    result = await update_issue_details(issue_id, update_data, project_tool)
+    
+    if not result:
+        raise HTTPException(status_code=404, detail=f"Issue {issue_id} not found")
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=f"Failed to update issue: {result['error']}")
         
-        if "error" in result:
-            raise HTTPException(status_code=400, detail=f"Failed to update issue: {result['error']}")
-            
-        response_data = {
-            "message": f"Successfully updated issue {issue_id}",
-            "issue": result
-        }
+    response_data = {
+        "message": f"Successfully updated issue {issue_id}",
+        "issue": result
+    }
+    
+    # No assignee warnings needed
         
-        # No assignee warnings needed
-            
-        return JSONResponse(response_data)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error updating issue: {str(e)}")
+    return ORJSONResponse(response_data)
 
 
 @router.delete("/issues/{issue_id}")
@@ -632,16 +688,12 @@ async def remove_issue(
     - issue_id: ID of the issue to delete
     - project_tool: Optional project management tool to use (defaults to the one in settings)
     """
-    try:
-        result = await delete_issue(issue_id, project_tool)
+    result = await delete_issue(issue_id, project_tool)
+    
+    if not result.get("success", False):
+        raise HTTPException(status_code=400, detail=f"Failed to delete issue: {result.get('error', 'Unknown error')}")
         
-        if not result.get("success", False):
-            raise HTTPException(status_code=400, detail=f"Failed to delete issue: {result.get('error', 'Unknown error')}")
-            
-        return JSONResponse({
-            "message": f"Successfully deleted issue {issue_id}",
-            "success": True
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting issue: {str(e)}")
-
+    return ORJSONResponse({
+        "message": f"Successfully deleted issue {issue_id}",
+        "success": True
+    })
\ No newline at end of file
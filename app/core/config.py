@@ -6,6 +6,7 @@ load_dotenv()
 class Settings:
     # Application Settings
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
     SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
     SERVER_NAME = os.getenv("SERVER_NAME", "localhost")
     SERVER_HOST = os.getenv("SERVER_HOST", "http://localhost:8000")
@@ -16,18 +17,34 @@ class Settings:
     # OpenAI Settings
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "5"))
+    OPENAI_CHUNKS_PER_REQUEST = int(os.getenv("OPENAI_CHUNKS_PER_REQUEST", "4"))
     
     # JIRA Settings
     JIRA_SERVER_URL = os.getenv("JIRA_SERVER_URL")
+    # REST base URL, normalized once at startup (trailing slash removed)
+    JIRA_API_URL = f"{JIRA_SERVER_URL.rstrip('/')}/rest/api/3" if JIRA_SERVER_URL else None
     JIRA_EMAIL = os.getenv("JIRA_EMAIL")
     JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
     JIRA_PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY", "KAN")
     JIRA_ISSUE_TYPE = os.getenv("JIRA_ISSUE_TYPE", "Task")
+    JIRA_CONCURRENCY = int(os.getenv("JIRA_CONCURRENCY", "8"))
+    JIRA_RPS = float(os.getenv("JIRA_RPS", "10"))
+    # Total attempts per Jira request; at least one, or requests would silently never be sent
+    JIRA_MAX_RETRIES = max(1, int(os.getenv("JIRA_MAX_RETRIES", "5")))
+    JIRA_MAX_IN_FLIGHT = int(os.getenv("JIRA_MAX_IN_FLIGHT", "10"))
     
     # Project Management Settings
     DEFAULT_PROJECT_MANAGEMENT_TOOL = os.getenv("DEFAULT_PROJECT_MANAGEMENT_TOOL", "jira").lower()
     
     # Background Task Settings
     MAX_BACKGROUND_WORKERS = int(os.getenv("MAX_BACKGROUND_WORKERS", "4"))
+    
+    # Extraction Cache Settings (number of entries kept in memory, 0 disables)
+    DOCUMENT_CACHE_SIZE = int(os.getenv("DOCUMENT_CACHE_SIZE", "64"))
+    CHUNK_CACHE_SIZE = int(os.getenv("CHUNK_CACHE_SIZE", "2048"))
+    
+    # Obligation List Cache Settings
+    OBLIGATION_CACHE_TTL = float(os.getenv("OBLIGATION_CACHE_TTL", "30"))
 
 settings = Settings()
\ No newline at end of file
@@ -1,7 +1,47 @@
-from fastapi import FastAPI
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from app.api.routes import router as api_router
+from app.core.config import settings
+from app.core.responses import ORJSONResponse
+from app.services.project_management.jira import close_http_session
+from app.utils.logger import ColorLogger as log
 
-app = FastAPI(title="Legal Obligation Extraction")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared process pool for CPU-bound document work (chunking) so it never blocks the event loop
+    app.state.cpu_pool = ProcessPoolExecutor(max_workers=settings.MAX_BACKGROUND_WORKERS)
+    try:
+        yield
+    finally:
+        app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
+        # Release pooled keep-alive connections to Jira
+        await close_http_session()
+
+
+app = FastAPI(
+    title="Legal Obligation Extraction",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Compress larger JSON responses (obligation and issue lists); moderate level keeps CPU cost low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    Single fallback for unexpected errors raised by any route.
+    HTTPException is handled by FastAPI before reaching here, so its status code is preserved.
+    The traceback goes to the log only; clients get a generic message so internals aren't leaked.
+    """
+    trace = "".join(traceback.format_exception(exc))
+    log.error(f"Unhandled error on {request.method} {request.url.path}: {exc!r}\n{trace}")
+    return ORJSONResponse({"detail": "Internal server error"}, status_code=500)
 
 # Register the API router under /api/v1 prefix
 app.include_router(api_router, prefix="/api/v1")
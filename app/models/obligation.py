@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from datetime import datetime
 import uuid
 
@@ -18,11 +18,28 @@ class Obligation(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     jira_issue_id: Optional[str] = None
     
+    # Case-insensitive party lookup key, normalized on write so reads don't recompute it (not serialized)
+    _party_name_key: str = PrivateAttr(default="")
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._party_name_key = self.party_name.casefold()
+    
+    @property
+    def party_name_key(self) -> str:
+        """Casefolded party name used for filtering and indexing."""
+        return self._party_name_key
+    
     def update(self, **kwargs):
-        """Update obligation fields and set updated_at timestamp."""
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        """
+        Update obligation fields and set updated_at timestamp.
+        The merged values are validated first, so an invalid update raises ValidationError
+        and leaves the obligation unchanged.
+        """
+        changes = {key: value for key, value in kwargs.items() if key in type(self).model_fields}
+        validated = self.model_validate({**self.model_dump(), **changes})
+        for key in changes:
+            setattr(self, key, getattr(validated, key))
+        self._party_name_key = self.party_name.casefold()
         self.updated_at = datetime.now()
 
 
@@ -33,6 +50,14 @@ class ObligationUpdate(BaseModel):
     deadline: Optional[str] = None
     party_name: Optional[str] = None
     priority: Optional[str] = None
+    
+    @field_validator("obligation_text", "party_name", "priority")
+    @classmethod
+    def _reject_null(cls, value: Optional[str]) -> str:
+        """These fields may be omitted but not cleared; an explicit null is a validation error."""
+        if value is None:
+            raise ValueError("may be omitted but cannot be null")
+        return value
 
 
 class ObligationResponse(BaseModel):
@@ -146,3 +146,24 @@ REMEMBER:
 - When in doubt, DO NOT include borderline statements
 
 Your task is to process the input text and extract ONLY GENUINE, MATERIAL OBLIGATIONS following these guidelines. Be highly selective, precise, and maintain the specified output format.'''
+
+
+MULTI_CHUNK_INSTRUCTIONS = '''
+
+MULTIPLE CHUNKS PER REQUEST:
+The input may contain several document chunks, each delimited as:
+<<<CHUNK id=ID>>>
+...chunk context and content...
+<<<END>>>
+
+Process every chunk independently using the rules above, and return one entry per chunk, using the chunk's id:
+   {
+     "chunks": [
+       {
+         "id": "ID",
+         "parties": [ ...same structure as above... ]
+       }
+     ]
+   }
+
+Include every chunk id exactly once, with an empty "parties" list if the chunk contains no obligations.'''
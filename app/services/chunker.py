@@ -1,19 +1,23 @@
 from typing import List, Dict
 import re
+from app.core.config import settings
 from app.utils.logger import ColorLogger as log
 
+# Section header pattern, compiled once since it runs against every paragraph
+_SECTION_RE = re.compile(r'^(?:Section|SECTION|Art\.|ARTICLE)\s*([\d\.]+)\s*[:\-]?\s*(.+)?$')
+
 def extract_section_info(text: str) -> Dict[str, str]:
     """
     Extract section number and title from text if present.
     """
-    section_pattern = r'^(?:Section|SECTION|Art\.|ARTICLE)\s*([\d\.]+)\s*[:\-]?\s*(.+)?$'
-    match = re.match(section_pattern, text.strip())
+    match = _SECTION_RE.match(text.strip())
     if match:
         section_info = {
             'section_number': match.group(1),
             'section_title': match.group(2).strip() if match.group(2) else ''
         }
-        log.info(f"📑 Found section {section_info['section_number']}: {section_info['section_title']}")
+        if settings.DEBUG:
+            log.info(f"📑 Found section {section_info['section_number']}: {section_info['section_title']}")
         return section_info
     return None
 
@@ -25,17 +29,22 @@ def chunk_text(pages: List[str], max_tokens: int = 800) -> List[Dict[str, str]]:
     """
     log.info(f"🔄 Starting document chunking process - {len(pages)} pages to process")
     chunks = []
-    current_chunk = ""
+    # Paragraphs of the chunk being built, joined once when the chunk is emitted
+    buf: List[str] = []
+    buf_len = 0
+    limit = max_tokens * 4
     current_section = {'number': '', 'title': ''}
     current_page = 0
     total_chars = 0
 
     for page_num, page in enumerate(pages, 1):
         log.processing(f"Processing page {page_num}/{len(pages)}", indent=1)
-        paragraphs = [p for p in page.split("\n") if p.strip()]
         total_chars += len(page)
         
-        for paragraph in paragraphs:
+        # Single C-level split; blank lines are skipped in the loop without building a filtered copy
+        for paragraph in page.splitlines():
+            if not paragraph or paragraph.isspace():
+                continue
             # Check if this is a section header
             section_info = extract_section_info(paragraph)
             if section_info:
@@ -45,33 +54,37 @@ def chunk_text(pages: List[str], max_tokens: int = 800) -> List[Dict[str, str]]:
                 }
                 
             # Check if adding this paragraph would exceed the token limit
-            if len(current_chunk) + len(paragraph) < max_tokens * 4:
-                current_chunk += paragraph + "\n"
+            if buf_len + len(paragraph) < limit:
+                buf.append(paragraph)
+                buf_len += len(paragraph) + 1
             else:
-                if current_chunk.strip():
+                current_chunk = "\n".join(buf).strip()
+                if current_chunk:
                     chunk_data = {
-                        'text': current_chunk.strip(),
+                        'text': current_chunk,
                         'section_number': current_section['number'],
                         'section_title': current_section['title'],
                         'page_number': current_page,
                         'context': f"Page {current_page}, Section {current_section['number']}: {current_section['title']}"
                     }
                     chunks.append(chunk_data)
-                    log.chunk(f"Created chunk {len(chunks)} ({len(current_chunk)} chars)", indent=2)
-                current_chunk = paragraph + "\n"
+                    log.chunk(f"Created chunk {len(chunks)} ({buf_len} chars)", indent=2)
+                buf = [paragraph]
+                buf_len = len(paragraph) + 1
                 current_page = page_num
 
     # Add the last chunk if it exists
-    if current_chunk.strip():
+    current_chunk = "\n".join(buf).strip()
+    if current_chunk:
         chunk_data = {
-            'text': current_chunk.strip(),
+            'text': current_chunk,
             'section_number': current_section['number'],
             'section_title': current_section['title'],
             'page_number': current_page,
             'context': f"Page {current_page}, Section {current_section['number']}: {current_section['title']}"
         }
         chunks.append(chunk_data)
-        log.chunk(f"Created final chunk {len(chunks)} ({len(current_chunk)} chars)", indent=2)
+        log.chunk(f"Created final chunk {len(chunks)} ({buf_len} chars)", indent=2)
 
     avg_chunk_size = total_chars / len(chunks) if chunks else 0
     log.success(f"✨ Chunking complete! Created {len(chunks)} chunks (avg {avg_chunk_size:.0f} chars per chunk)")
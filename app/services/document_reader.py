@@ -1,48 +1,135 @@
 import fitz
-from typing import List, Dict, Any
+from concurrent.futures import Executor
+from typing import List, Dict, Any, BinaryIO, Iterator, Optional
 import io
-import docx
+import zipfile
+from lxml import etree
+from app.core.config import settings
 from app.utils.logger import ColorLogger as log
 
-def extract_text_from_pdf(file_bytes: bytes) -> List[str]:
+# WordprocessingML element tags used when streaming DOCX paragraphs
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY, _W_P, _W_R, _W_T = f"{_W_NS}body", f"{_W_NS}p", f"{_W_NS}r", f"{_W_NS}t"
+_W_BREAKS = {f"{_W_NS}tab": "\t", f"{_W_NS}br": "\n", f"{_W_NS}cr": "\n"}
+
+# Default plain-text flags minus ligature and whitespace preservation: ligatures are expanded to plain letters
+# (so "ﬁ" matches "fi" in prompts and dedupe) and unusual whitespace becomes plain spaces, which is all the
+# chunker needs
+_PDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~(fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE)
+
+# PDFs with fewer pages than this are extracted serially; splitting them isn't worth the overhead
+PARALLEL_PDF_MIN_PAGES = 8
+
+def _iter_document_pages(doc: fitz.Document, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of pages [start, stop) of an open document, loading one page at a time."""
+    for i in range(start, doc.page_count if stop is None else stop):
+        yield doc.load_page(i).get_text("text", flags=_PDF_TEXT_FLAGS, sort=False)
+
+def iter_pdf_pages(file_bytes: bytes, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """
+    Lazily extract text from PDF bytes, one page at a time.
+    Each page's MuPDF buffers can be freed as soon as its text is consumed, and the document
+    is closed when iteration finishes or the iterator is discarded.
+    
+    Args:
+        file_bytes: Raw bytes of the PDF file
+        start: Index of the first page to extract
+        stop: Index after the last page to extract (defaults to the end of the document)
+        
+    Returns:
+        Iterator over the text content of each page
+    """
+    with fitz.open(stream=memoryview(file_bytes), filetype="pdf") as doc:
+        yield from _iter_document_pages(doc, start, stop)
+
+def _extract_pdf_page_range(file_bytes: bytes, start: int, stop: int) -> List[str]:
+    """Extract text from pages [start, stop) of a PDF. Runs in a worker process with its own document."""
+    return list(iter_pdf_pages(file_bytes, start, stop))
+
+def extract_text_from_pdf(file_bytes: bytes, executor: Optional[Executor] = None) -> List[str]:
     """
     Extract text from PDF bytes. Return list of text per page.
     
     Args:
         file_bytes: Raw bytes of the PDF file
+        executor: Optional process pool used to extract page ranges of large PDFs in parallel
         
     Returns:
         List of text content per page
     """
     try:
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        pages = [page.get_text() for page in doc]
-        doc.close()
+        # A memoryview lets MuPDF read any bytes-like buffer in place (a bytearray would otherwise be copied)
+        with fitz.open(stream=memoryview(file_bytes), filetype="pdf") as doc:
+            page_count = doc.page_count
+            if executor is None or page_count < PARALLEL_PDF_MIN_PAGES:
+                return list(_iter_document_pages(doc))
+        
+        # MuPDF documents can't be shared across threads, so each worker process opens its own copy
+        # and extracts one contiguous range of pages
+        workers = max(1, min(settings.MAX_BACKGROUND_WORKERS, page_count))
+        range_size = -(-page_count // workers)
+        futures = [
+            executor.submit(_extract_pdf_page_range, file_bytes, start, min(start + range_size, page_count))
+            for start in range(0, page_count, range_size)
+        ]
+        
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
         return pages
     except Exception as e:
         log.error(f"Error extracting text from PDF: {str(e)}")
         return []
 
-def extract_text_from_docx(file_bytes: bytes) -> List[str]:
+def _iter_docx_paragraphs(file_obj: BinaryIO) -> Iterator[str]:
+    """
+    Stream paragraph texts out of word/document.xml without building the whole document tree.
+    
+    Args:
+        file_obj: Seekable binary file-like object of the DOCX file
+        
+    Returns:
+        Iterator over the text of each paragraph
+    """
+    with zipfile.ZipFile(file_obj) as archive, archive.open("word/document.xml") as xml:
+        for _, elem in etree.iterparse(xml, tag=_W_P):
+            parts = []
+            for node in elem.iter(_W_T, *_W_BREAKS):
+                # Tab stops in paragraph properties share the tab tag; only run content counts
+                if node.getparent().tag != _W_R:
+                    continue
+                parts.append((node.text or "") if node.tag == _W_T else _W_BREAKS[node.tag])
+            yield "".join(parts)
+            
+            # Free the parsed paragraph; nested paragraphs (e.g. text boxes) are cleared before their
+            # parent is read, so their text isn't repeated
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None and parent.tag == _W_BODY:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+def extract_text_from_docx(file_obj: BinaryIO) -> List[str]:
     """
-    Extract text from DOCX bytes. Return list of text per paragraph.
+    Extract text from a DOCX stream. Return list of text per paragraph.
     
     Args:
-        file_bytes: Raw bytes of the DOCX file
+        file_obj: Binary file-like object (or raw bytes) of the DOCX file
         
     Returns:
         List of text content per paragraph
     """
     try:
-        doc = docx.Document(io.BytesIO(file_bytes))
+        if isinstance(file_obj, (bytes, bytearray)):
+            file_obj = io.BytesIO(file_obj)
         
         # Group paragraphs into "pages" (roughly 3000 characters per page)
         pages = []
         current_page = ""
         char_count = 0
         
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        for paragraph in _iter_docx_paragraphs(file_obj):
+            text = paragraph.strip()
             if not text:
                 continue
                 
@@ -63,21 +150,23 @@ def extract_text_from_docx(file_bytes: bytes) -> List[str]:
         log.error(f"Error extracting text from DOCX: {str(e)}")
         return []
 
-def extract_text_from_document(file_bytes: bytes, content_type: str) -> List[str]:
+def extract_text_from_document(file_obj: BinaryIO, content_type: str, executor: Optional[Executor] = None) -> List[str]:
     """
-    Extract text from document bytes based on content type.
+    Extract text from a readable document stream based on content type.
     
     Args:
-        file_bytes: Raw bytes of the document file
+        file_obj: Binary file-like object positioned at the start of the document
         content_type: MIME type of the document
+        executor: Optional process pool for parallel PDF page extraction
         
     Returns:
         List of text content
     """
     if content_type == "application/pdf":
-        return extract_text_from_pdf(file_bytes)
+        # MuPDF needs random access to the whole buffer (the xref table lives at the end)
+        return extract_text_from_pdf(file_obj.read(), executor)
     elif content_type in ["application/vnd.openxmlformats-officedocument.wordprocessingml.document", "application/docx"]:
-        return extract_text_from_docx(file_bytes)
+        return extract_text_from_docx(file_obj)
     else:
         log.error(f"Unsupported document type: {content_type}")
         return []
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, List, Optional
+import copy
+import hashlib
+from app.core.config import settings
+from app.utils.logger import ColorLogger as log
+
+# Simple in-memory LRU caches keyed by content fingerprints
+# Documents: fingerprint of the uploaded file -> extracted chunks and obligations
+# Chunks: fingerprint of a chunk's text -> raw LLM result for that chunk
+_document_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_chunk_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def fingerprint(data: bytes) -> str:
+    """Return a stable content fingerprint for raw bytes."""
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def fingerprint_stream(file_obj: BinaryIO, sink: Optional[BinaryIO] = None, chunk_size: int = 1 << 20) -> str:
+    """
+    Return the content fingerprint of a binary stream, reading it in chunks.
+    When a sink is given, each chunk is also written to it, so copying and hashing take a single pass.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    while chunk := file_obj.read(chunk_size):
+        digest.update(chunk)
+        if sink is not None:
+            sink.write(chunk)
+    return digest.hexdigest()
+
+
+def _get(cache: "OrderedDict[str, Any]", key: str) -> Optional[Any]:
+    value = cache.get(key)
+    if value is None:
+        return None
+    cache.move_to_end(key)
+    # Callers mutate results (party standardization, source annotation), so hand out copies
+    return copy.deepcopy(value)
+
+
+def _put(cache: "OrderedDict[str, Any]", key: str, value: Any, max_size: int) -> None:
+    if max_size <= 0:
+        return
+    cache[key] = copy.deepcopy(value)
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def get_cached_document(document_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Get previously extracted results for a document.
+
+    Args:
+        document_hash: Fingerprint of the uploaded document bytes
+
+    Returns:
+        Dict with chunks and obligations if cached, None otherwise
+    """
+    cached = _get(_document_cache, document_hash)
+    if cached is not None:
+        log.info(f"Document cache hit for {document_hash[:12]}")
+    return cached
+
+
+def cache_document(document_hash: str, chunks: List[Dict[str, Any]],
+                   obligations: List[Dict[str, Any]]) -> None:
+    """
+    Cache extraction results for a document.
+
+    Args:
+        document_hash: Fingerprint of the uploaded document bytes
+        chunks: Chunks built from the document text
+        obligations: Obligations extracted from the chunks
+    """
+    _put(
+        _document_cache,
+        document_hash,
+        {"chunks": chunks, "obligations": obligations},
+        settings.DOCUMENT_CACHE_SIZE
+    )
+
+
+def get_cached_chunk_result(chunk_text: str) -> Optional[Dict[str, Any]]:
+    """Get the cached LLM result for a chunk's text, if any."""
+    return _get(_chunk_cache, fingerprint(chunk_text.encode("utf-8")))
+
+
+def cache_chunk_result(chunk_text: str, result: Dict[str, Any]) -> None:
+    """Cache the LLM result for a chunk's text."""
+    _put(_chunk_cache, fingerprint(chunk_text.encode("utf-8")), result, settings.CHUNK_CACHE_SIZE)
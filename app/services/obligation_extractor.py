@@ -1,138 +1,274 @@
 import asyncio
-import json
-from openai import AsyncOpenAI
+import hashlib
+from collections import defaultdict
+from functools import lru_cache
+import re
+import orjson
+from openai import APIStatusError, AsyncOpenAI, RateLimitError
 from app.core.config import settings
-from typing import List, Dict, Set
+from typing import AsyncIterator, Awaitable, Callable, DefaultDict, FrozenSet, List, Dict, Optional, Set
 from app.prompts import Obligation_Prompt
+from app.services.extraction_cache import get_cached_chunk_result, cache_chunk_result
+from app.utils.retry import retry_delay
 from app.utils.logger import ColorLogger as log
 
 client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-BATCH_SIZE = 5  # Process 5 chunks at a time
 MAX_RETRIES = 3
+# Upper bound on the backoff between failed extraction attempts (seconds)
+MAX_RETRY_DELAY = 30
+
+# Parenthetical section references such as "(Section 4.2)" or "(§ 3)", and any remaining punctuation
+_SECTION_REF_RE = re.compile(r'\(\s*(?:section|sec\.|art\.|article|§)?\s*[\d.]+[a-z]?\s*\)', re.IGNORECASE)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Obligations whose 3-word shingle sets overlap at least this much are treated as paraphrases
+NEAR_DUPLICATE_THRESHOLD = 0.9
+SHINGLE_SIZE = 3
+
+def _canonicalize(text: str) -> str:
+    """Normalize obligation text so formatting differences don't defeat duplicate detection"""
+    text = _SECTION_REF_RE.sub(' ', text.lower())
+    text = _PUNCTUATION_RE.sub(' ', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+def _text_hash(text: str) -> int:
+    """Stable 64-bit hash (unlike hash(), identical across processes and restarts)"""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+@lru_cache(maxsize=1024)
+def _canonical_party_name(name: str) -> str:
+    """Title Case party name; every casing of the same name maps to the same result"""
+    return name.strip().title()
 
 class ObligationTracker:
+    # Chunk groups run as concurrent coroutines on one event loop. The methods below never await,
+    # so each check-then-add runs atomically and the shared state needs no lock.
     def __init__(self):
-        self.seen_obligations: Set[str] = set()
-        self.party_names: Dict[str, str] = {}
+        self.seen_obligations: Set[int] = set()
+        self.seen_shingles: List[FrozenSet[int]] = []
 
     def is_duplicate(self, obligation_text: str) -> bool:
-        """Check if an obligation is duplicate based on its text"""
-        text_hash = hash(obligation_text.lower().strip())
+        """Check if an obligation is an exact or near duplicate of one already seen"""
+        canonical = _canonicalize(obligation_text)
+        text_hash = _text_hash(canonical)
         if text_hash in self.seen_obligations:
             return True
+        
+        words = canonical.split()
+        shingles = frozenset(
+            _text_hash(" ".join(words[i:i + SHINGLE_SIZE]))
+            for i in range(max(1, len(words) - SHINGLE_SIZE + 1))
+        )
+        for seen in self.seen_shingles:
+            # Jaccard similarity can't reach the threshold when the set sizes differ too much
+            if min(len(seen), len(shingles)) < NEAR_DUPLICATE_THRESHOLD * max(len(seen), len(shingles)):
+                continue
+            if len(seen & shingles) >= NEAR_DUPLICATE_THRESHOLD * len(seen | shingles):
+                return True
+        
         self.seen_obligations.add(text_hash)
+        self.seen_shingles.append(shingles)
         return False
 
     def standardize_party_name(self, name: str) -> str:
         """Standardize party name to maintain consistency"""
-        key = name.lower().strip()
-        if key not in self.party_names:
-            # Store the first occurrence in Title Case
-            self.party_names[key] = name.title()
-        return self.party_names[key]
+        return _canonical_party_name(name)
 
-async def process_chunk(chunk: Dict[str, str], tracker: ObligationTracker) -> Dict:
-    log.chunk(f"Processing chunk from section {chunk['section_number']} (Page {chunk['page_number']})")
-    
+def _chunk_content(chunk: Dict[str, str]) -> str:
+    """Chunk text prefixed with its page/section context"""
+    return f"Context: {chunk['context']}\n\nContent:\n{chunk['text']}"
+
+async def _request_extraction(system_prompt: str, user_content: str) -> Optional[Dict]:
+    """Send one extraction request, retrying on failure. Returns the parsed JSON (None for a null answer)."""
     for attempt in range(MAX_RETRIES):
         try:
-            # Add context to the chunk content
-            content_with_context = f"Context: {chunk['context']}\n\nContent:\n{chunk['text']}"
-            
             log.processing(f"Sending to OpenAI (Attempt {attempt + 1}/{MAX_RETRIES})", indent=1)
             response = await client.chat.completions.create(
                 model="gpt-4o-mini",  
                 messages=[
-                    {"role": "system", "content": Obligation_Prompt.SYSTEM_PROMPT},
-                    {"role": "user", "content": content_with_context}
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
                 ],
                 temperature=0.2,
                 response_format={"type": "json_object"}
             )
             
             content = response.choices[0].message.content
-            if content.strip().lower() != "null":
-                result = json.loads(content)
-                
-                # Process each party's obligations
-                if "parties" in result:
-                    for party in result["parties"]:
-                        # Standardize party name
-                        original_name = party["name"]
-                        party["name"] = tracker.standardize_party_name(party["name"])
-                        if original_name != party["name"]:
-                            log.party(f"Standardized party name: {original_name} → {party['name']}", indent=1)
-                        
-                        # Filter out duplicate obligations
-                        if "obligations" in party:
-                            original_count = len(party["obligations"])
-                            party["obligations"] = [
-                                {**ob, "section": chunk["section_number"]}
-                                for ob in party["obligations"]
-                                if not tracker.is_duplicate(ob["obligation_text"])
-                            ]
-                            filtered_count = len(party["obligations"])
-                            
-                            if filtered_count > 0:
-                                log.obligation(f"Found {filtered_count} new obligations for {party['name']}", indent=1)
-                            if original_count > filtered_count:
-                                log.warning(f"Filtered out {original_count - filtered_count} duplicate obligations", indent=2)
-                
-                log.success(f"Successfully processed chunk", indent=1)
-                return result
-            
+            if content.strip().lower() == "null":
+                return None
+            return orjson.loads(content)
+        except RateLimitError as e:
+            # Honor the server's Retry-After so concurrent requests don't all retry at the same moment
+            delay = retry_delay(e.response.headers, attempt)
+            error = e
+        except APIStatusError as e:
+            if e.status_code < 500:
+                # Other client errors won't succeed on retry
+                log.error(f"OpenAI rejected the extraction request: {e}")
+                return None
+            delay = retry_delay({}, attempt, MAX_RETRY_DELAY)
+            error = e
         except Exception as e:
-            if attempt == MAX_RETRIES - 1:
-                print(f"Error processing chunk after {MAX_RETRIES} attempts: {e}")
-            await asyncio.sleep(1)  # Back off before retry
+            delay = retry_delay({}, attempt, MAX_RETRY_DELAY)
+            error = e
+        
+        if attempt == MAX_RETRIES - 1:
+            log.error(f"Error processing chunk after {MAX_RETRIES} attempts: {error}")
+            return None
+        log.warning(f"Extraction attempt {attempt + 1} failed ({error}); retrying in {delay:.1f}s", indent=1)
+        await asyncio.sleep(delay)  # Back off with jitter before retry
     return None
 
-async def extract_obligation_from_chunks(chunks: List[Dict[str, str]]) -> List[Dict]:
+async def _fetch_chunk_results(chunks: List[Dict[str, str]]) -> List[Optional[Dict]]:
+    """
+    Get the raw LLM result for each chunk, in order.
+    Cached chunks are reused; the rest are sent together in a single multi-chunk request.
+    """
+    results: List[Optional[Dict]] = [get_cached_chunk_result(chunk['text']) for chunk in chunks]
+    pending = [i for i, result in enumerate(results) if result is None]
+    if len(pending) < len(chunks):
+        log.info(f"Using cached results for {len(chunks) - len(pending)} chunks", indent=1)
+    
+    if len(pending) > 1:
+        # One request for the whole group; each chunk is delimited and answered under its own id
+        user_content = "\n\n".join(
+            f"<<<CHUNK id={i}>>>\n{_chunk_content(chunks[i])}\n<<<END>>>" for i in pending
+        )
+        response = await _request_extraction(
+            Obligation_Prompt.SYSTEM_PROMPT + Obligation_Prompt.MULTI_CHUNK_INSTRUCTIONS, user_content
+        )
+        # The model's output isn't trusted to be well-formed: anything malformed or missing an id
+        # is treated as unanswered and falls back to a per-chunk request
+        items = response.get("chunks") if isinstance(response, dict) else None
+        answered = {
+            str(item["id"]): item
+            for item in (items if isinstance(items, list) else [])
+            if isinstance(item, dict) and item.get("id") is not None
+        }
+        for i in pending:
+            result = answered.get(str(i))
+            if result is not None:
+                result.pop("id", None)
+                results[i] = result
+                cache_chunk_result(chunks[i]['text'], result)
+        # Chunks the model skipped are retried one at a time below
+        pending = [i for i in pending if results[i] is None]
+    
+    for i in pending:
+        result = await _request_extraction(Obligation_Prompt.SYSTEM_PROMPT, _chunk_content(chunks[i]))
+        if isinstance(result, dict):
+            results[i] = result
+            cache_chunk_result(chunks[i]['text'], result)
+    return results
+
+def _normalize_chunk_result(result: Dict, chunk: Dict[str, str], tracker: ObligationTracker) -> Dict:
+    """Standardize party names and drop duplicate obligations across the document"""
+    log.chunk(f"Processing chunk from section {chunk['section_number']} (Page {chunk['page_number']})")
+    
+    # Process each party's obligations
+    if "parties" in result:
+        for party in result["parties"]:
+            # Standardize party name
+            original_name = party["name"]
+            party["name"] = tracker.standardize_party_name(party["name"])
+            if original_name != party["name"]:
+                log.party(f"Standardized party name: {original_name} → {party['name']}", indent=1)
+            
+            # Filter out duplicate obligations
+            if "obligations" in party:
+                original_count = len(party["obligations"])
+                party["obligations"] = [
+                    {**ob, "section": chunk["section_number"]}
+                    for ob in party["obligations"]
+                    if not tracker.is_duplicate(ob["obligation_text"])
+                ]
+                filtered_count = len(party["obligations"])
+                
+                if filtered_count > 0:
+                    log.obligation(f"Found {filtered_count} new obligations for {party['name']}", indent=1)
+                if original_count > filtered_count:
+                    log.warning(f"Filtered out {original_count - filtered_count} duplicate obligations", indent=2)
+    
+    log.success(f"Successfully processed chunk", indent=1)
+    return result
+
+async def process_chunks(chunks: List[Dict[str, str]], tracker: ObligationTracker) -> List[Optional[Dict]]:
+    """
+    Extract obligations from a group of consecutive chunks with as few LLM calls as possible.
+    Returns one result per chunk, in order (None where nothing could be extracted).
+    """
+    results = await _fetch_chunk_results(chunks)
+    return [
+        _normalize_chunk_result(result, chunk, tracker) if result is not None else None
+        for chunk, result in zip(chunks, results)
+    ]
+
+async def process_chunk(chunk: Dict[str, str], tracker: ObligationTracker) -> Optional[Dict]:
+    return (await process_chunks([chunk], tracker))[0]
+
+def _chunk_groups(chunks: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+    """Split chunks into consecutive groups that share one request, cutting per-call latency and overhead"""
+    group_size = max(1, settings.OPENAI_CHUNKS_PER_REQUEST)
+    return [chunks[i:i + group_size] for i in range(0, len(chunks), group_size)]
+
+def _group_worker(tracker: ObligationTracker) -> Callable[[List[Dict[str, str]]], Awaitable[List[Optional[Dict]]]]:
+    """
+    Build the coroutine function that processes one chunk group.
+    Every group is scheduled up front; the shared semaphore keeps at most OPENAI_CONCURRENCY calls in flight,
+    so a new group starts as soon as any other finishes.
+    """
+    semaphore = asyncio.Semaphore(settings.OPENAI_CONCURRENCY)
+    
+    async def process_with_limit(group: List[Dict[str, str]]) -> List[Optional[Dict]]:
+        async with semaphore:
+            return await process_chunks(group, tracker)
+    
+    return process_with_limit
+
+async def iter_obligations_from_chunks(chunks: List[Dict[str, str]]) -> AsyncIterator[Dict]:
+    """
+    Yield per-chunk extraction results in chunk order as soon as each one is ready.
+    Duplicate obligations and party names are normalized across the whole document.
+    """
     log.info(f"🚀 Starting obligation extraction for {len(chunks)} chunks")
-    results = []
-    tracker = ObligationTracker()
+    process_with_limit = _group_worker(ObligationTracker())
+    groups = _chunk_groups(chunks)
     
-    # Process chunks in batches
-    total_batches = (len(chunks) + BATCH_SIZE - 1) // BATCH_SIZE
-    for i in range(0, len(chunks), BATCH_SIZE):
-        current_batch = i // BATCH_SIZE + 1
-        batch = chunks[i:i + BATCH_SIZE]
-        log.processing(f"Processing batch {current_batch}/{total_batches} ({len(batch)} chunks)")
-        
-        tasks = [process_chunk(chunk, tracker) for chunk in batch]
-        batch_results = await asyncio.gather(*tasks)
-        
-        # Filter out None results and extend the results list
-        valid_results = [r for r in batch_results if r is not None]
-        results.extend(valid_results)
-        
-        log.success(f"Completed batch {current_batch}/{total_batches} with {len(valid_results)} valid results")
-        
-        # Add a small delay between batches to avoid rate limits
-        if i + BATCH_SIZE < len(chunks):
-            log.info("Waiting before next batch to avoid rate limits...", indent=1)
-            await asyncio.sleep(0.5)
+    # A TaskGroup can't be held open across yields, so tasks are cancelled explicitly instead
+    tasks = [asyncio.create_task(process_with_limit(group)) for group in groups]
+    try:
+        completed = 0
+        for group, task in zip(groups, tasks):
+            for result in await task:
+                if result is not None:
+                    yield result
+            completed += len(group)
+            log.processing(f"Completed {completed}/{len(chunks)} chunks")
+    finally:
+        # Stop outstanding LLM calls if the consumer goes away early
+        for task in tasks:
+            task.cancel()
+
+async def extract_obligation_from_chunks(chunks: List[Dict[str, str]]) -> List[Dict]:
+    log.info(f"🚀 Starting obligation extraction for {len(chunks)} chunks")
+    process_with_limit = _group_worker(ObligationTracker())
     
-    # Merge results by party
-    log.processing("Merging results by party...")
-    merged_results = {}
-    total_obligations = 0
+    # The task group cancels the remaining LLM calls if any group fails unexpectedly
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [task_group.create_task(process_with_limit(group)) for group in _chunk_groups(chunks)]
     
-    for result in results:
-        if "parties" in result:
-            for party in result["parties"]:
-                party_name = party["name"]
-                if party_name not in merged_results:
-                    merged_results[party_name] = {
-                        "name": party_name,
-                        "obligations": []
-                    }
-                merged_results[party_name]["obligations"].extend(party["obligations"])
-                total_obligations += len(party["obligations"])
+    # Merge results by party, in chunk order
+    merged_results: DefaultDict[str, List[Dict]] = defaultdict(list)
+    for task in tasks:
+        for result in task.result():
+            if result is None:
+                continue
+            for party in result.get("parties", ()):
+                merged_results[party["name"]].extend(party.get("obligations", ()))
     
+    total_obligations = sum(len(obligations) for obligations in merged_results.values())
     log.success(f"✨ Extraction complete! Found {total_obligations} obligations across {len(merged_results)} parties")
     
-    return [{"parties": list(merged_results.values())}]
-            
-                
\ No newline at end of file
+    return [{"parties": [{"name": name, "obligations": obligations} for name, obligations in merged_results.items()]}]
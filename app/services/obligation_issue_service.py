@@ -1,36 +1,20 @@
+import asyncio
+import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
+from app.core.config import settings
 from app.services.project_management.factory import ProjectManagementFactory
 from app.utils.logger import ColorLogger as log
 
+# Deadline phrases that raise or lower the issue priority ("immediate"/"immediately", "no ... deadline")
+_IMMEDIATE_RE = re.compile(r'\bimmediate', re.IGNORECASE)
+_NO_DEADLINE_RE = re.compile(r'\bno\b.*\bdeadline', re.IGNORECASE | re.DOTALL)
 
-async def create_obligation_issue(obligation: Dict[str, Any], party_name: str, 
-                                 tool_name: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Create an issue in the project management tool for a legal obligation.
-    
-    Args:
-        obligation: The obligation dictionary containing details
-        party_name: The name of the party responsible for the obligation
-        tool_name: Optional name of the project management tool to use
-        
-    Returns:
-        Dict containing the created issue details
-    """
-    try:
-        # Get the appropriate project management tool
-        pm_tool = ProjectManagementFactory.get_tool(tool_name)
-        
-        # Extract obligation details
-        obligation_text = obligation.get("obligation_text", "")
-        section = obligation.get("section", "Unknown")
-        deadline = obligation.get("deadline", "Not specified")
-        priority = obligation.get("priority", "Medium")
-        
-        # Create a descriptive title
-        title = f"Legal Obligation: {obligation_text[:50]}..." if len(obligation_text) > 50 else f"Legal Obligation: {obligation_text}"
-        
-        # Create a detailed description
-        description = f"""
+# Maximum obligation text length used in issue titles
+TITLE_TEXT_LENGTH = 50
+
+# Issue description layout, filled in per obligation
+_DESCRIPTION_TEMPLATE = """
 ## Legal Obligation Details
 
 **Obligation Text:**
@@ -45,26 +29,84 @@ async def create_obligation_issue(obligation: Dict[str, Any], party_name: str,
 **Additional Notes:**
 This obligation was automatically extracted from a legal document.
 """
+
+LEGAL_OBLIGATION_LABEL = "legal-obligation"
+
+
+@lru_cache(maxsize=1024)
+def _party_label(party_name: str) -> str:
+    """Label identifying the responsible party, built once per party name."""
+    return f"party-{party_name.lower().replace(' ', '-')}"
+
+
+def _build_issue_request(obligation: Dict[str, Any], party_name: str) -> Dict[str, Any]:
+    """
+    Build the create_issue arguments for a legal obligation.
+    
+    Args:
+        obligation: The obligation dictionary containing details
+        party_name: The name of the party responsible for the obligation
         
-        # Add labels for better organization
-        labels = ["legal-obligation", f"party-{party_name.lower().replace(' ', '-')}"]
+    Returns:
+        Dict of create_issue keyword arguments
+    """
+    # Extract obligation details
+    obligation_text = obligation.get("obligation_text", "")
+    section = obligation.get("section", "Unknown")
+    deadline = obligation.get("deadline", "Not specified")
+    
+    # Create a descriptive title
+    summary = obligation_text[:TITLE_TEXT_LENGTH]
+    title = f"Legal Obligation: {summary}..." if len(obligation_text) > TITLE_TEXT_LENGTH else f"Legal Obligation: {summary}"
+    
+    # Create a detailed description
+    description = _DESCRIPTION_TEMPLATE.format(
+        obligation_text=obligation_text,
+        party_name=party_name,
+        section=section,
+        deadline=deadline
+    )
+    
+    # Add labels for better organization
+    labels = [LEGAL_OBLIGATION_LABEL, _party_label(party_name)]
+    
+    # Map the deadline to a Jira priority
+    priority = "Medium"  # Default priority
+    if deadline and _IMMEDIATE_RE.search(deadline):
+        priority = "High"
+    elif deadline and _NO_DEADLINE_RE.search(deadline):
+        priority = "Low"
+    
+    return {
+        "title": title,
+        "description": description,
+        "priority": priority,
+        "labels": labels,
+        "lock_description": True  # Always lock the description for legal obligations
+    }
+
+
+async def create_obligation_issue(obligation: Dict[str, Any], party_name: str, 
+                                 tool_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Create an issue in the project management tool for a legal obligation.
+    
+    Args:
+        obligation: The obligation dictionary containing details
+        party_name: The name of the party responsible for the obligation
+        tool_name: Optional name of the project management tool to use
         
-        # Map priority from obligation to Jira priority
-        priority = "Medium"  # Default priority
-        if deadline and "immediate" in deadline.lower():
-            priority = "High"
-        elif deadline and "no" in deadline.lower() and "deadline" in deadline.lower():
-            priority = "Low"
+    Returns:
+        Dict containing the created issue details
+    """
+    try:
+        # Get the appropriate project management tool
+        pm_tool = ProjectManagementFactory.get_tool(tool_name)
+        issue_request = _build_issue_request(obligation, party_name)
         
         # Create the issue in the project management tool
-        log.info(f"Creating issue for obligation: {obligation_text[:50]}...")
-        issue = await pm_tool.create_issue(
-            title=title,
-            description=description,
-            priority=priority,
-            labels=labels,
-            lock_description=True  # Always lock the description for legal obligations
-        )
+        log.info(f"Creating issue for obligation: {issue_request['title']}")
+        issue = await pm_tool.create_issue(**issue_request)
         
         return issue
     except Exception as e:
@@ -84,9 +126,8 @@ async def create_issues_for_all_obligations(obligations_data: List[Dict[str, Any
     Returns:
         List of responses from issue creation
     """
-    results = []
-    
-    # Process each result in the obligations data
+    # Collect (obligation, party) pairs from each result in the obligations data
+    pairs = []
     for result in obligations_data:
         if "parties" in result:
             for party in result["parties"]:
@@ -96,11 +137,35 @@ async def create_issues_for_all_obligations(obligations_data: List[Dict[str, Any
                     log.info(f"Processing {len(party['obligations'])} obligations for {party_name}")
                     
                     for obligation in party["obligations"]:
-                        response = await create_obligation_issue(obligation, party_name, tool_name)
-                        results.append({
-                            "party": party_name,
-                            "obligation": obligation,
-                            "issue_response": response
-                        })
+                        pairs.append((obligation, party_name))
+    
+    # Tools with a batch API create every issue in one call
+    try:
+        pm_tool = ProjectManagementFactory.get_tool(tool_name)
+    except Exception:
+        pm_tool = None  # create_obligation_issue reports the error per obligation
+    if pairs and hasattr(pm_tool, "create_issues"):
+        try:
+            responses = await pm_tool.create_issues([_build_issue_request(o, p) for o, p in pairs])
+        except Exception as e:
+            log.error(f"Error creating issues for obligations: {str(e)}")
+            responses = [{"error": str(e)}] * len(pairs)
+        return [
+            {"party": party_name, "obligation": obligation, "issue_response": response}
+            for (obligation, party_name), response in zip(pairs, responses)
+        ]
+    
+    # Bound concurrent calls to stay within the project management tool's rate limits
+    semaphore = asyncio.Semaphore(settings.JIRA_CONCURRENCY)
+    
+    async def create_with_limit(obligation: Dict[str, Any], party_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            response = await create_obligation_issue(obligation, party_name, tool_name)
+        return {
+            "party": party_name,
+            "obligation": obligation,
+            "issue_response": response
+        }
     
-    return results
+    # gather preserves input order, so results line up with the obligations
+    return await asyncio.gather(*(create_with_limit(obligation, party_name) for obligation, party_name in pairs))
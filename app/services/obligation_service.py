@@ -1,43 +1,160 @@
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set
 from app.models.obligation import Obligation, ObligationUpdate
-import json
+import orjson
 import os
 from datetime import datetime
 import uuid
+from app.core.config import settings
 from app.utils.logger import ColorLogger as log
+from app.utils.ttl_cache import TTLCache
 
 # Simple in-memory storage for obligations
 # In a production environment, this would be replaced with a database
 _obligations_store: List[Obligation] = []
+# Obligations by ID, kept in step with _obligations_store for O(1) lookups
+_obligations_index: Dict[str, Obligation] = {}
+# Obligations grouped by casefolded party name, each list in store order
+_by_party: Dict[str, List[Obligation]] = defaultdict(list)
+# JSON-ready dumps of obligations by ID, reused across list pages until the obligation changes
+_dump_cache: Dict[str, Dict[str, Any]] = {}
+# IDs of obligations whose Jira issue is being created, so overlapping requests don't create a second one
+_issue_creation_in_flight: Set[str] = set()
 
-# File path for persistence (simple JSON file)
-OBLIGATIONS_FILE = "obligations_data.json"
+# File path for persistence: an append-only JSON Lines log of add/update/delete records
+OBLIGATIONS_FILE = "obligations_data.jsonl"
+# Previous whole-store JSON file, migrated into the log on first load
+LEGACY_OBLIGATIONS_FILE = "obligations_data.json"
 
+# The log is rewritten from the live store once superseded records exceed this fraction of it
+COMPACTION_THRESHOLD = 0.3
 
-def _save_obligations_to_file():
-    """Save obligations to a JSON file for persistence."""
+# Number of records in the log file and how many of them are updates/deletes or superseded adds
+_log_records = 0
+_stale_records = 0
+
+# Short-lived cache of list pages absorbing repeated requests from the UI; invalidated on every mutation
+_list_cache = TTLCache(256, settings.OBLIGATION_CACHE_TTL)
+
+
+def _invalidate_caches(*obligation_ids: str):
+    """Drop cached list pages and the dumps of changed obligations after a mutation."""
+    for obligation_id in obligation_ids:
+        _dump_cache.pop(obligation_id, None)
+    _list_cache.clear()
+
+
+def dump_obligation(obligation: Obligation) -> Dict[str, Any]:
+    """
+    Get the JSON-ready dict of an obligation, reusing the cached dump while it is unchanged.
+    
+    Args:
+        obligation: Obligation to dump
+        
+    Returns:
+        Dictionary of the obligation's fields (shared; callers must not modify it)
+    """
+    dumped = _dump_cache.get(obligation.id)
+    if dumped is None:
+        dumped = obligation.model_dump(mode="json")
+        _dump_cache[obligation.id] = dumped
+    return dumped
+
+
+def _rebuild_indexes():
+    """Rebuild the lookup indexes from _obligations_store."""
+    global _obligations_index, _by_party
+    _obligations_index = {ob.id: ob for ob in _obligations_store}
+    _dump_cache.clear()
+    _by_party = defaultdict(list)
+    for ob in _obligations_store:
+        _by_party[ob.party_name_key].append(ob)
+
+
+def _compact_log():
+    """Rewrite the log with one add record per live obligation, replacing the file atomically."""
+    global _log_records, _stale_records
+    try:
+        tmp_file = f"{OBLIGATIONS_FILE}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(
+                orjson.dumps({"op": "add", "obligation": ob.model_dump()}) + b"\n" for ob in _obligations_store
+            ))
+        os.replace(tmp_file, OBLIGATIONS_FILE)
+        _log_records = len(_obligations_store)
+        _stale_records = 0
+    except Exception as e:
+        log.error(f"Error compacting obligations file: {str(e)}")
+
+
+def _append_to_log(records: List[Dict[str, Any]], stale: int = 0):
+    """
+    Append change records to the obligations log instead of rewriting the whole store.
+    
+    Args:
+        records: Records to append ({"op": "add" | "update" | "delete", ...})
+        stale: Number of records (existing or new) that no longer describe live state after this write
+    """
+    global _log_records, _stale_records
+    if not records:
+        return
     try:
-        # Custom JSON encoder to handle datetime objects
-        def datetime_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
-            
-        with open(OBLIGATIONS_FILE, "w") as f:
-            json.dump([ob.model_dump() for ob in _obligations_store], f, default=datetime_serializer)
+        # orjson serializes datetimes natively as ISO-8601 strings
+        with open(OBLIGATIONS_FILE, "ab") as f:
+            f.write(b"".join(orjson.dumps(record) + b"\n" for record in records))
+        _log_records += len(records)
+        _stale_records += stale
     except Exception as e:
         log.error(f"Error saving obligations to file: {str(e)}")
+        return
+    
+    if _stale_records > COMPACTION_THRESHOLD * _log_records:
+        _compact_log()
 
 
 def _load_obligations_from_file():
-    """Load obligations from a JSON file if it exists."""
-    global _obligations_store
+    """Load obligations by replaying the log file, migrating the legacy JSON file if needed."""
+    global _obligations_store, _log_records, _stale_records
     try:
-        if os.path.exists(OBLIGATIONS_FILE):
-            with open(OBLIGATIONS_FILE, "r") as f:
-                data = json.load(f)
-                _obligations_store = [Obligation(**item) for item in data]
-                log.info(f"Loaded {len(_obligations_store)} obligations from file")
+        if not os.path.exists(OBLIGATIONS_FILE):
+            if os.path.exists(LEGACY_OBLIGATIONS_FILE):
+                with open(LEGACY_OBLIGATIONS_FILE, "rb") as f:
+                    _obligations_store = [Obligation(**item) for item in orjson.loads(f.read())]
+                _rebuild_indexes()
+                _compact_log()
+                log.info(f"Migrated {len(_obligations_store)} obligations from {LEGACY_OBLIGATIONS_FILE}")
+            return
+        
+        live: Dict[str, Dict[str, Any]] = {}
+        records = 0
+        with open(OBLIGATIONS_FILE, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A torn final line from an interrupted write; everything before it is intact
+                    log.warning("Skipping unreadable record in obligations file")
+                    continue
+                records += 1
+                op = record.get("op")
+                if op == "add":
+                    item = record["obligation"]
+                    live[item["id"]] = item
+                elif op == "update" and record["id"] in live:
+                    live[record["id"]].update(record["fields"])
+                elif op == "delete":
+                    live.pop(record["id"], None)
+        
+        _obligations_store = [Obligation(**item) for item in live.values()]
+        _rebuild_indexes()
+        _log_records = records
+        _stale_records = records - len(_obligations_store)
+        log.info(f"Loaded {len(_obligations_store)} obligations from file")
+        
+        if _stale_records > COMPACTION_THRESHOLD * _log_records:
+            _compact_log()
     except Exception as e:
         log.error(f"Error loading obligations from file: {str(e)}")
 
@@ -46,12 +163,13 @@ def _load_obligations_from_file():
 _load_obligations_from_file()
 
 
-def store_obligations(obligations_data: List[Dict[str, Any]]) -> List[Obligation]:
+def store_obligations(obligations_data: List[Dict[str, Any]], source_document: Optional[str] = None) -> List[Obligation]:
     """
     Store extracted obligations from document analysis.
     
     Args:
         obligations_data: List of obligation data dictionaries
+        source_document: Optional name of the document the obligations were extracted from
         
     Returns:
         List of stored Obligation objects
@@ -73,53 +191,43 @@ def store_obligations(obligations_data: List[Dict[str, Any]]) -> List[Obligation
                             section=obligation_data.get("section", ""),
                             deadline=obligation_data.get("deadline", "Not specified"),
                             party_name=party_name,
-                            source_document=obligation_data.get("source_document", None),
+                            source_document=obligation_data.get("source_document", source_document),
                             source_page=obligation_data.get("page_number", None)
                         )
                         _obligations_store.append(obligation)
+                        _obligations_index[obligation.id] = obligation
+                        _by_party[obligation.party_name_key].append(obligation)
                         stored_obligations.append(obligation)
     
-    # Save to file for persistence
-    _save_obligations_to_file()
+    # Append only the new obligations to the log
+    _append_to_log([{"op": "add", "obligation": ob.model_dump()} for ob in stored_obligations])
+    _invalidate_caches()
     
     return stored_obligations
 
 
-def get_all_obligations(
-    page: int = 1, 
-    page_size: int = 10, 
-    party_name: Optional[str] = None
-) -> Dict[str, Any]:
+def paginate_obligations(obligations: Sequence[Obligation], page: int, page_size: int) -> Dict[str, Any]:
     """
-    Get all stored obligations with pagination.
+    Slice one page of obligations and compute the pagination info in a single place.
     
     Args:
-        page: Page number (1-indexed)
+        obligations: Obligations to paginate
+        page: Page number (1-indexed), clamped to the valid range
         page_size: Number of items per page
-        party_name: Filter by party name (optional)
         
     Returns:
-        Dictionary with obligations and pagination info
+        Dictionary with the page of obligations and pagination info
     """
-    # Filter by party name if provided
-    filtered_obligations = _obligations_store
-    if party_name:
-        filtered_obligations = [ob for ob in _obligations_store if ob.party_name.lower() == party_name.lower()]
-    
-    # Calculate pagination
-    total_items = len(filtered_obligations)
+    total_items = len(obligations)
     total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 1
     
     # Ensure page is within valid range
     page = max(1, min(page, total_pages))
     
-    # Get paginated results
+    # Only the requested page is converted to dictionaries
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
-    paginated_obligations = filtered_obligations[start_idx:end_idx]
-    
-    # Convert Obligation objects to dictionaries
-    paginated_obligations_dict = [ob.model_dump() for ob in paginated_obligations]
+    paginated_obligations_dict = [dump_obligation(ob) for ob in obligations[start_idx:end_idx]]
     
     return {
         "obligations": paginated_obligations_dict,
@@ -136,6 +244,38 @@ def get_all_obligations(
     }
 
 
+def get_all_obligations(
+    page: int = 1, 
+    page_size: int = 10, 
+    party_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get all stored obligations with pagination.
+    
+    Args:
+        page: Page number (1-indexed)
+        page_size: Number of items per page
+        party_name: Filter by party name (optional)
+        
+    Returns:
+        Dictionary with obligations and pagination info
+    """
+    party_key = party_name.casefold() if party_name else None
+    cache_key = (page, page_size, party_key)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Filter by party name if provided, using the party index rather than scanning the store
+    filtered_obligations = _obligations_store
+    if party_key:
+        filtered_obligations = _by_party.get(party_key, [])
+    
+    result = paginate_obligations(filtered_obligations, page, page_size)
+    _list_cache.set(cache_key, result)
+    return result
+
+
 def get_obligation_by_id(obligation_id: str) -> Optional[Obligation]:
     """
     Get an obligation by its ID.
@@ -146,10 +286,24 @@ def get_obligation_by_id(obligation_id: str) -> Optional[Obligation]:
     Returns:
         Obligation object if found, None otherwise
     """
-    for obligation in _obligations_store:
-        if obligation.id == obligation_id:
-            return obligation
-    return None
+    return _obligations_index.get(obligation_id)
+
+
+def get_obligations_by_ids(obligation_ids: List[str]) -> Dict[str, Obligation]:
+    """
+    Get multiple obligations by their IDs.
+    
+    Args:
+        obligation_ids: IDs of the obligations to retrieve
+        
+    Returns:
+        Dictionary mapping found obligation IDs to Obligation objects
+    """
+    return {
+        obligation_id: _obligations_index[obligation_id]
+        for obligation_id in obligation_ids
+        if obligation_id in _obligations_index
+    }
 
 
 def update_obligation(obligation_id: str, update_data: ObligationUpdate) -> Optional[Obligation]:
@@ -167,10 +321,19 @@ def update_obligation(obligation_id: str, update_data: ObligationUpdate) -> Opti
     if obligation:
         # Update fields
         update_dict = update_data.model_dump(exclude_unset=True)
+        previous_party_key = obligation.party_name_key
         obligation.update(**update_dict)
+        if obligation.party_name_key != previous_party_key:
+            # Rare; a rebuild keeps every party list in store order
+            _rebuild_indexes()
         
-        # Save changes
-        _save_obligations_to_file()
+        # Log only the changed fields
+        _append_to_log(
+            [{"op": "update", "id": obligation_id,
+              "fields": obligation.model_dump(include={*update_dict, "updated_at"})}],
+            stale=1
+        )
+        _invalidate_caches(obligation_id)
         
         return obligation
     return None
@@ -186,12 +349,23 @@ def delete_obligation(obligation_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    global _obligations_store
+    obligation = _obligations_index.pop(obligation_id, None)
+    if obligation is None:
+        return False
+    
+    party_obligations = _by_party.get(obligation.party_name_key, [])
+    for i, stored in enumerate(party_obligations):
+        if stored is obligation:
+            party_obligations.pop(i)
+            break
     
-    for i, obligation in enumerate(_obligations_store):
-        if obligation.id == obligation_id:
+    # Remove by identity so listing order is preserved
+    for i, stored in enumerate(_obligations_store):
+        if stored is obligation:
             _obligations_store.pop(i)
-            _save_obligations_to_file()
+            # The delete record and the obligation's earlier records are all stale now
+            _append_to_log([{"op": "delete", "id": obligation_id}], stale=2)
+            _invalidate_caches(obligation_id)
             return True
     
     return False
@@ -212,6 +386,63 @@ def set_jira_issue_id(obligation_id: str, jira_issue_id: str) -> Optional[Obliga
     if obligation:
         obligation.jira_issue_id = jira_issue_id
         obligation.updated_at = datetime.now()
-        _save_obligations_to_file()
+        _append_to_log(
+            [{"op": "update", "id": obligation_id,
+              "fields": {"jira_issue_id": jira_issue_id, "updated_at": obligation.updated_at}}],
+            stale=1
+        )
+        _invalidate_caches(obligation_id)
         return obligation
     return None
+
+
+def claim_issue_creation(obligation_id: str) -> bool:
+    """
+    Mark an obligation as having its Jira issue created by the caller.
+    
+    Args:
+        obligation_id: ID of the obligation
+        
+    Returns:
+        True if claimed, False if another request is already creating its issue
+    """
+    if obligation_id in _issue_creation_in_flight:
+        return False
+    _issue_creation_in_flight.add(obligation_id)
+    return True
+
+
+def release_issue_creation(obligation_ids: Iterable[str]):
+    """Release claims taken with claim_issue_creation, once the resulting issue IDs are recorded."""
+    _issue_creation_in_flight.difference_update(obligation_ids)
+
+
+def set_jira_issue_ids(issue_ids: Dict[str, str]) -> List[Obligation]:
+    """
+    Set Jira issue IDs for multiple obligations and persist once.
+    
+    Args:
+        issue_ids: Dictionary mapping obligation IDs to Jira issue IDs
+        
+    Returns:
+        List of updated Obligation objects
+    """
+    if not issue_ids:
+        return []
+    
+    now = datetime.now()
+    updated_obligations = []
+    for obligation_id, obligation in get_obligations_by_ids(list(issue_ids)).items():
+        obligation.jira_issue_id = issue_ids[obligation_id]
+        obligation.updated_at = now
+        updated_obligations.append(obligation)
+    
+    if updated_obligations:
+        _append_to_log(
+            [{"op": "update", "id": obligation.id,
+              "fields": {"jira_issue_id": obligation.jira_issue_id, "updated_at": now}}
+             for obligation in updated_obligations],
+            stale=len(updated_obligations)
+        )
+        _invalidate_caches(*(obligation.id for obligation in updated_obligations))
+    return updated_obligations
@@ -62,3 +62,10 @@ class ProjectManagementTool(ABC):
             True if deletion was successful, False otherwise
         """
         pass
+    
+    async def close(self) -> None:
+        """
+        Release any resources (e.g. network sessions) held by the tool.
+        Tools without such resources don't need to override this.
+        """
+        pass
@@ -1,3 +1,4 @@
+import threading
 from typing import Dict, Type
 from app.core.config import settings
 from .base import ProjectManagementTool
@@ -19,10 +20,16 @@ class ProjectManagementFactory:
         # "asana": AsanaProjectManagement,
     }
     
+    # Tool instances are stateless apart from their shared HTTP session (or, for the mock, its
+    # in-memory issues), so one instance per tool name is reused across requests
+    _instances: Dict[str, ProjectManagementTool] = {}
+    _instances_lock = threading.Lock()
+    _default_tool_name: str = settings.DEFAULT_PROJECT_MANAGEMENT_TOOL.lower()
+    
     @classmethod
     def get_tool(cls, tool_name: str = None) -> ProjectManagementTool:
         """
-        Get an instance of the specified project management tool.
+        Get the shared instance of the specified project management tool, creating it on first use.
         If no tool is specified, use the default from settings.
         
         Args:
@@ -36,10 +43,14 @@ class ProjectManagementFactory:
         """
         # Use default tool if none specified
         if not tool_name:
-            tool_name = settings.DEFAULT_PROJECT_MANAGEMENT_TOOL.lower()
+            tool_name = cls._default_tool_name
         else:
             tool_name = tool_name.lower()
         
+        instance = cls._instances.get(tool_name)
+        if instance is not None:
+            return instance
+        
         # Check if the tool is supported
         if tool_name not in cls._registry:
             supported_tools = ", ".join(cls._registry.keys())
@@ -48,12 +59,15 @@ class ProjectManagementFactory:
                 f"Supported tools are: {supported_tools}"
             )
         
-        # Use mock implementation for Jira if credentials are not set
-        if tool_name == "jira" and (not settings.JIRA_SERVER_URL or not settings.JIRA_API_TOKEN):
-            from app.utils.logger import ColorLogger as log
-            log.warning("Jira credentials not found. Using mock Jira implementation.")
-            return MockJiraProjectManagement()
-        
-        # Create and return an instance of the tool
-        tool_class = cls._registry[tool_name]
-        return tool_class()
+        with cls._instances_lock:
+            instance = cls._instances.get(tool_name)
+            if instance is None:
+                # Use mock implementation for Jira if credentials are not set
+                if tool_name == "jira" and (not settings.JIRA_SERVER_URL or not settings.JIRA_API_TOKEN):
+                    from app.utils.logger import ColorLogger as log
+                    log.warning("Jira credentials not found. Using mock Jira implementation.")
+                    instance = MockJiraProjectManagement()
+                else:
+                    instance = cls._registry[tool_name]()
+                cls._instances[tool_name] = instance
+        return instance
@@ -1,10 +1,108 @@
+import asyncio
 import aiohttp
-import json
-from typing import Dict, Any, Optional
+import base64
+import orjson
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from datetime import datetime
 from app.core.config import settings
 from app.utils.logger import ColorLogger as log
+from app.utils.retry import retry_delay
+from app.utils.ttl_cache import TTLCache
 from .base import ProjectManagementTool
+from .rate_limit import AsyncTokenBucket
+
+
+# Shared across instances so every Jira call in the process draws from the same budget
+_rate_limiter = AsyncTokenBucket(settings.JIRA_RPS)
+
+# Workflows change rarely, so resolved transition IDs are reused for this many seconds
+TRANSITION_CACHE_TTL = 300
+
+# Issues requested per search page (Jira's maximum for the search endpoint)
+SEARCH_PAGE_SIZE = 100
+
+# Jira expects specific priority names like "Highest", "High", "Medium", "Low", "Lowest";
+# common variations map to the standard names
+_PRIORITY_MAP: Mapping[str, str] = MappingProxyType({
+    "highest": "Highest",
+    "higher": "High",
+    "high": "High",
+    "medium": "Medium",
+    "normal": "Medium",
+    "low": "Low",
+    "lowest": "Lowest"
+})
+
+# Fields returned for issue lists; the ADF description is by far the largest field, so it is left to get_issue
+SEARCH_FIELDS = ("summary", "status", "priority", "labels", "updated")
+
+# Caps Jira requests in flight across the process, below Jira's per-user concurrency limit
+_request_slots = asyncio.Semaphore(settings.JIRA_MAX_IN_FLIGHT)
+
+# Responses retried with backoff (honoring Retry-After), and the methods that are safe to resend
+# after a network error
+RETRY_STATUSES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# One pooled keep-alive session per process, so Jira calls reuse TCP/TLS connections
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session for Jira calls, creating it on first use.
+    Creation never awaits, so concurrent callers on the event loop can't race to build two sessions.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=20, keepalive_timeout=60, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=60)
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session (called on application shutdown)."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+def _adjust_rate_limit(headers) -> None:
+    """Follow the fill rate Jira advertises in its rate-limit response headers."""
+    fill_rate = headers.get("X-RateLimit-FillRate")
+    interval = headers.get("X-RateLimit-Interval-Seconds")
+    if fill_rate and interval:
+        try:
+            _rate_limiter.set_rate(float(fill_rate) / float(interval))
+        except (ValueError, ZeroDivisionError):
+            pass
+
+
+def _wrap_adf(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format document."""
+    return {"version": 1, "type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]}
+
+
+@dataclass(slots=True)
+class JiraResponse:
+    """Outcome of a single Jira API call, so callers branch on one flag instead of probing dict keys."""
+    ok: bool
+    data: Any = field(default_factory=dict)
+    error: Optional[str] = None
+    status: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict form returned through the ProjectManagementTool interface."""
+        if self.ok:
+            return self.data
+        if self.status:
+            return {"error": self.error, "status_code": self.status}
+        return {"error": self.error}
 
 
 class JiraProjectManagement(ProjectManagementTool):
@@ -12,20 +110,37 @@ class JiraProjectManagement(ProjectManagementTool):
     Jira implementation of the ProjectManagementTool interface.
     """
     
-    def __init__(self):
-        self.server_url = settings.JIRA_SERVER_URL
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # An explicit session can be injected; otherwise the shared process-wide session is used
+        self._session = session
         self.email = settings.JIRA_EMAIL
         self.api_token = settings.JIRA_API_TOKEN
         self.project_key = settings.JIRA_PROJECT_KEY
         self.issue_type = settings.JIRA_ISSUE_TYPE
+        self.api_url = settings.JIRA_API_URL
         
-        # Remove trailing slash if present
-        if self.server_url.endswith('/'):
-            self.server_url = self.server_url[:-1]
-            
-        self.api_url = f"{self.server_url}/rest/api/3"
+        # Fixed issue fields, shared by every create request (only ever serialized, never mutated)
+        self._project_field = {"key": self.project_key}
+        self._issuetype_field = {"name": self.issue_type}
         
-    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
+        # Credentials and headers are the same for every request, so build them once; passing the
+        # pre-encoded Authorization header saves aiohttp re-encoding BasicAuth on every call
+        token = base64.b64encode(f"{self.email}:{self.api_token}".encode("utf-8")).decode("ascii")
+        self._headers = {
+            "Authorization": f"Basic {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+        
+        # (project key, lowercased status name) -> transition ID
+        self._transition_cache = TTLCache(maxsize=256, ttl=TRANSITION_CACHE_TTL)
+    
+    async def close(self) -> None:
+        """Close an injected session. The shared session is closed on application shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> JiraResponse:
         """
         Make a request to the Jira API.
         
@@ -35,49 +150,135 @@ class JiraProjectManagement(ProjectManagementTool):
             data: Request data
             
         Returns:
-            Response data as dictionary
+            JiraResponse with the parsed body on success, or the error message and status code
         """
         url = f"{self.api_url}/{endpoint}"
-        auth = aiohttp.BasicAuth(self.email, self.api_token)
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
         
-        # Log the request details for debugging
-        log.info(f"Making request to Jira API: {method} {url}")
+        # Log the request details for debugging (payloads can be whole ADF documents, so only formatted at DEBUG level)
+        log.debug_fmt("Making request to Jira API: %s %s", method, url)
         if data:
-            log.info(f"Request data: {data}")
+            log.debug_fmt("Request data: %s", data)
             
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.request(
-                    method=method,
-                    url=url,
-                    auth=auth,
-                    headers=headers,
-                    json=data
-                ) as response:
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        log.error(f"Jira API error: {response.status} - {error_text}")
-                        return {"error": error_text, "status_code": response.status}
-                    
-                    # Handle 204 No Content responses (common for PUT/DELETE operations)
-                    if response.status == 204:
-                        return {"success": True}
-                    
-                    # For other successful responses, parse JSON
-                    try:
-                        return await response.json()
-                    except Exception as e:
-                        # If response cannot be parsed as JSON, return text content
-                        content = await response.text()
-                        return {"content": content, "success": True}
-            except Exception as e:
-                log.error(f"Error making request to Jira API: {str(e)}")
-                return {"error": str(e)}
+        # Serialize once up front with orjson rather than aiohttp's stdlib-json path on every attempt
+        body = orjson.dumps(data) if data is not None else None
+        
+        session = self._session or get_http_session()
+        try:
+            for attempt in range(settings.JIRA_MAX_RETRIES):
+                last_attempt = attempt == settings.JIRA_MAX_RETRIES - 1
+                await _rate_limiter.acquire()
+                try:
+                    async with _request_slots, session.request(
+                        method=method,
+                        url=url,
+                        headers=self._headers,
+                        data=body
+                    ) as response:
+                        _adjust_rate_limit(response.headers)
+                        
+                        # Back off and retry when Jira rate-limits us or is briefly unavailable
+                        if response.status in RETRY_STATUSES and not last_attempt:
+                            delay = retry_delay(response.headers, attempt)
+                            response.release()
+                            log.warning(
+                                f"Jira responded {response.status}, retrying in {delay:.1f}s "
+                                f"(attempt {attempt + 1}/{settings.JIRA_MAX_RETRIES})"
+                            )
+                        else:
+                            return await self._read_response(response)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # A failed POST may still have been applied, so only idempotent calls are retried
+                    if method not in IDEMPOTENT_METHODS or last_attempt:
+                        raise
+                    delay = retry_delay({}, attempt)
+                    log.warning(f"Jira request failed ({e!r}), retrying in {delay:.1f}s (attempt {attempt + 1}/{settings.JIRA_MAX_RETRIES})")
+                
+                # Sleep outside the request slot so backing-off calls don't hold up others
+                await asyncio.sleep(delay)
+        except Exception as e:
+            log.error(f"Error making request to Jira API: {str(e)}")
+            return JiraResponse(False, error=str(e))
     
+    @staticmethod
+    async def _read_response(response: aiohttp.ClientResponse) -> JiraResponse:
+        """Turn a final Jira HTTP response into a JiraResponse."""
+        if response.status >= 400:
+            error_text = await response.text()
+            log.error(f"Jira API error: {response.status} - {error_text}")
+            return JiraResponse(False, error=error_text, status=response.status)
+        
+        # Handle 204 No Content responses (common for PUT/DELETE operations)
+        if response.status == 204:
+            return JiraResponse(True, {"success": True}, status=204)
+        
+        # For other successful responses, parse JSON
+        content = await response.read()
+        try:
+            return JiraResponse(True, orjson.loads(content), status=response.status)
+        except orjson.JSONDecodeError:
+            # If response cannot be parsed as JSON, return text content
+            return JiraResponse(
+                True, {"content": content.decode("utf-8", errors="replace"), "success": True}, status=response.status
+            )
+
+    async def _set_editable_property(self, issue_key: str) -> None:
+        """Set the jira.issue.editable=false property to make the entire issue non-editable."""
+        editable_data = {
+            "jira.issue.editable": "false"
+        }
+        
+        # Use the properties endpoint to set the issue as non-editable
+        editable_response = await self._make_request(
+            "PUT",
+            f"issue/{issue_key}/properties/jira.issue.editable",
+            editable_data
+        )
+        
+        if not editable_response.ok:
+            log.warning(f"Failed to set issue as non-editable: {editable_response.error}")
+        else:
+            log.success(f"Successfully set issue {issue_key} as non-editable")
+    
+    async def _add_lock_comment(self, issue_key: str) -> None:
+        """Add a comment to the issue indicating that the description is locked."""
+        comment_data = {
+            "body": {
+                "version": 1,
+                "type": "doc",
+                "content": [
+                    {
+                        "type": "panel",
+                        "attrs": {
+                            "panelType": "warning"
+                        },
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "⚠️ IMPORTANT: This issue is linked to a legal obligation. The description should not be modified.",
+                                        "marks": [{"type": "strong"}]
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            }
+        }
+        
+        comment_response = await self._make_request(
+            "POST",
+            f"issue/{issue_key}/comment",
+            comment_data
+        )
+        
+        if not comment_response.ok:
+            log.warning(f"Failed to add lock comment: {comment_response.error}")
+        else:
+            log.success(f"Added description lock notice to issue {issue_key}")
+
     async def create_issue(self, title: str, description: str, **kwargs) -> Dict[str, Any]:
         """
         Create an issue in Jira.
@@ -96,34 +297,13 @@ class JiraProjectManagement(ProjectManagementTool):
         """
         log.info(f"Creating Jira issue: {title}")
         
-        # Format description for Jira's Atlassian Document Format
-        description_adf = {
-            "version": 1,
-            "type": "doc",
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": description
-                        }
-                    ]
-                }
-            ]
-        }
-        
-        # Build the issue data
+        # Build the issue data, with the description in Jira's Atlassian Document Format
         issue_data = {
             "fields": {
-                "project": {
-                    "key": self.project_key
-                },
+                "project": self._project_field,
                 "summary": title,
-                "description": description_adf,
-                "issuetype": {
-                    "name": self.issue_type
-                }
+                "description": _wrap_adf(description),
+                "issuetype": self._issuetype_field
             }
         }
         
@@ -146,131 +326,24 @@ class JiraProjectManagement(ProjectManagementTool):
         
         response = await self._make_request("POST", "issue", issue_data)
         
-        if "error" in response:
-            log.error(f"Failed to create Jira issue: {response['error']}")
+        if not response.ok:
+            log.error(f"Failed to create Jira issue: {response.error}")
         else:
-            issue_key = response.get('key')
+            issue_key = response.data.get('key')
             log.success(f"Successfully created Jira issue with ID: {issue_key or 'Unknown'}")
             
-            # Set jira.issue.editable=false to make the entire issue non-editable
+            # The lock side effects are independent of each other, so run them concurrently
             if issue_key and lock_description:
-                try:
-                    # Set the issue.editable property to false
-                    editable_data = {
-                        "jira.issue.editable": "false"
-                    }
-                    
-                    # Use the properties endpoint to set the issue as non-editable
-                    editable_response = await self._make_request(
-                        "PUT",
-                        f"issue/{issue_key}/properties/jira.issue.editable",
-                        editable_data
-                    )
-                    
-                    if editable_response and "error" in editable_response:
-                        log.warning(f"Failed to set issue as non-editable: {editable_response['error']}")
-                    else:
-                        log.success(f"Successfully set issue {issue_key} as non-editable")
-                except Exception as e:
-                    log.warning(f"Error setting issue as non-editable: {str(e)}")
+                results = await asyncio.gather(
+                    self._set_editable_property(issue_key),
+                    self._add_lock_comment(issue_key),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        log.error(f"Error while trying to lock description field: {str(result)}")
             
-            # If we need to lock the description field and issue was created successfully
-            if lock_description and issue_key:
-                try:
-                    # Add a comment to the issue indicating that the description is locked
-                    comment_data = {
-                        "body": {
-                            "version": 1,
-                            "type": "doc",
-                            "content": [
-                                {
-                                    "type": "panel",
-                                    "attrs": {
-                                        "panelType": "warning"
-                                    },
-                                    "content": [
-                                        {
-                                            "type": "paragraph",
-                                            "content": [
-                                                {
-                                                    "type": "text",
-                                                    "text": "⚠️ IMPORTANT: This issue is linked to a legal obligation. The description should not be modified.",
-                                                    "marks": [{"type": "strong"}]
-                                                }
-                                            ]
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
-                    }
-                    
-                    # Add the comment to the issue
-                    try:
-                        comment_response = await self._make_request(
-                            "POST",
-                            f"issue/{issue_key}/comment",
-                            comment_data
-                        )
-                        
-                        if comment_response and "error" in comment_response:
-                            log.warning(f"Failed to add lock comment: {comment_response['error']}")
-                        else:
-                            log.success(f"Added description lock notice to issue {issue_key}")
-                    except Exception as e:
-                        log.warning(f"Error adding comment: {str(e)}")
-                    
-                    # Set the issue.editable=false property to make the description field non-editable
-                    try:
-                        # This is the key part that makes the description non-editable in Jira UI
-                        editable_data = {
-                            "fields": {
-                                "description": {
-                                    "editable": False
-                                }
-                            }
-                        }
-                        
-                        # Use the field configuration endpoint to make the description field non-editable
-                        editable_response = await self._make_request(
-                            "PUT",
-                            f"issue/{issue_key}/editable",
-                            editable_data
-                        )
-                        
-                        if editable_response and "error" in editable_response:
-                            log.warning(f"Failed to set description as non-editable: {editable_response['error']}")
-                        else:
-                            log.success(f"Successfully set description field as non-editable for issue {issue_key}")
-                            
-                        # Try another approach - set field properties directly
-                        field_props = {
-                            "update": {
-                                "issueProperties": [
-                                    {
-                                        "key": "description.editable",
-                                        "value": False
-                                    }
-                                ]
-                            }
-                        }
-                        
-                        props_response = await self._make_request(
-                            "PUT",
-                            f"issue/{issue_key}",
-                            field_props
-                        )
-                        
-                        if props_response and "error" in props_response:
-                            log.warning(f"Failed to set issue properties: {props_response['error']}")
-                        
-                    except Exception as e:
-                        log.warning(f"Error setting editable property: {str(e)}")
-                        
-                except Exception as e:
-                    log.error(f"Error while trying to lock description field: {str(e)}")
-            
-        return response
+        return response.to_dict()
     
     async def get_issue(self, issue_id: str) -> Dict[str, Any]:
         """
@@ -285,10 +358,10 @@ class JiraProjectManagement(ProjectManagementTool):
         log.info(f"Getting Jira issue: {issue_id}")
         response = await self._make_request("GET", f"issue/{issue_id}")
         
-        if "error" in response:
-            log.error(f"Failed to get Jira issue {issue_id}: {response['error']}")
+        if not response.ok:
+            log.error(f"Failed to get Jira issue {issue_id}: {response.error}")
             
-        return response
+        return response.to_dict()
     
     async def update_issue(self, issue_id: str, **kwargs) -> Dict[str, Any]:
         """
@@ -318,39 +391,11 @@ class JiraProjectManagement(ProjectManagementTool):
             
         # Update description if provided
         if "description" in kwargs:
-            description_adf = {
-                "version": 1,
-                "type": "doc",
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": kwargs["description"]
-                            }
-                        ]
-                    }
-                ]
-            }
-            update_data["fields"]["description"] = description_adf
+            update_data["fields"]["description"] = _wrap_adf(kwargs["description"])
             
         # Update priority if provided
         if "priority" in kwargs:
-            # Jira expects specific priority names like "Highest", "High", "Medium", "Low", "Lowest"
-            # Map common variations to standard Jira priority names
-            priority_map = {
-                "highest": "Highest",
-                "higher": "High",
-                "high": "High",
-                "medium": "Medium",
-                "normal": "Medium",
-                "low": "Low",
-                "lowest": "Lowest"
-            }
-            
-            priority_value = kwargs["priority"].lower()
-            standard_priority = priority_map.get(priority_value, "Medium")
+            standard_priority = _PRIORITY_MAP.get(kwargs["priority"].casefold(), "Medium")
             
             update_data["fields"]["priority"] = {
                 "name": standard_priority
@@ -364,39 +409,68 @@ class JiraProjectManagement(ProjectManagementTool):
         if "assignee" in kwargs:
             del kwargs["assignee"]
         
-        response = await self._make_request("PUT", f"issue/{issue_id}", update_data)
+        # A status-only update has nothing to PUT; go straight to the transition
+        if update_data["fields"]:
+            response = await self._make_request("PUT", f"issue/{issue_id}", update_data)
+        else:
+            response = JiraResponse(True, {"success": True})
         
-        # Handle status transition if provided
-        if "status" in kwargs and "error" not in response:
-            # Get available transitions
-            transitions = await self._make_request("GET", f"issue/{issue_id}/transitions")
-            
-            if "error" not in transitions and "transitions" in transitions:
-                # Find the transition ID for the requested status
-                transition_id = None
-                for transition in transitions["transitions"]:
-                    if transition["to"]["name"].lower() == kwargs["status"].lower():
-                        transition_id = transition["id"]
-                        break
-                
-                if transition_id:
-                    # Perform the transition
-                    transition_data = {
-                        "transition": {
-                            "id": transition_id
-                        }
-                    }
-                    await self._make_request("POST", f"issue/{issue_id}/transitions", transition_data)
+        # Handle status transition if provided; for a status-only update its outcome is the result
+        if "status" in kwargs and response.ok:
+            transition_response = await self._transition_issue(issue_id, kwargs["status"])
+            if not update_data["fields"]:
+                response = transition_response
         
         # No assignee handling
         
-        if "error" in response:
-            log.error(f"Failed to update Jira issue {issue_id}: {response['error']}")
+        if not response.ok:
+            log.error(f"Failed to update Jira issue {issue_id}: {response.error}")
         else:
             log.success(f"Successfully updated Jira issue: {issue_id}")
             
+        return response.to_dict()
+    
+
+    async def _fetch_transitions(self, issue_id: str) -> JiraResponse:
+        """Get the transitions available to an issue, caching each one's ID by target status for the project."""
+        response = await self._make_request("GET", f"issue/{issue_id}/transitions")
+        if response.ok:
+            for transition in response.data.get("transitions", []):
+                self._transition_cache.set((self.project_key, transition["to"]["name"].lower()), transition["id"])
         return response
     
+    async def _transition_issue(self, issue_id: str, status: str) -> JiraResponse:
+        """
+        Move an issue to the given status.
+        Transition IDs are cached per project, so only a miss costs a GET of the issue's transitions;
+        a cached ID that Jira rejects is refreshed once.
+        
+        Args:
+            issue_id: The ID of the issue to transition
+            status: Name of the target status
+            
+        Returns:
+            JiraResponse of the transition, or of the call that failed
+        """
+        key = (self.project_key, status.lower())
+        transition_id = self._transition_cache.get(key)
+        if transition_id is not None:
+            response = await self._make_request("POST", f"issue/{issue_id}/transitions", {"transition": {"id": transition_id}})
+            if response.status != 400:
+                return response
+            # The cached transition isn't available from this issue's current state
+            self._transition_cache.pop(key)
+        
+        response = await self._fetch_transitions(issue_id)
+        if not response.ok:
+            return response
+        for transition in response.data.get("transitions", []):
+            if transition["to"]["name"].lower() == key[1]:
+                return await self._make_request("POST", f"issue/{issue_id}/transitions", {"transition": {"id": transition["id"]}})
+        
+        # Unreachable statuses are skipped rather than failing the update
+        log.warning(f"No transition to status '{status}' is available for Jira issue {issue_id}")
+        return JiraResponse(True, {"success": True})
 
     async def delete_issue(self, issue_id: str) -> bool:
         """
@@ -411,22 +485,24 @@ class JiraProjectManagement(ProjectManagementTool):
         log.info(f"Deleting Jira issue: {issue_id}")
         response = await self._make_request("DELETE", f"issue/{issue_id}")
         
-        if "error" in response:
-            log.error(f"Failed to delete Jira issue {issue_id}: {response['error']}")
+        if not response.ok:
+            log.error(f"Failed to delete Jira issue {issue_id}: {response.error}")
             return False
         
         log.success(f"Successfully deleted Jira issue: {issue_id}")
         return True
         
-    async def search_issues(self, jql: str = None) -> Dict[str, Any]:
+    async def search_issues(self, jql: str = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
-        Search for issues in Jira using JQL (Jira Query Language).
+        Search for issues in Jira using JQL (Jira Query Language), following every page of results.
+        The first page reports the total, after which the remaining pages are fetched concurrently.
         
         Args:
             jql: JQL query string to search with. If None, will search for all issues in the project.
+            fields: Issue fields to return. Defaults to the summary fields used for issue lists.
             
         Returns:
-            Dict containing the search results
+            List of all matching issues
         """
         log.info("Searching for Jira issues")
         
@@ -434,20 +510,38 @@ class JiraProjectManagement(ProjectManagementTool):
         if jql is None:
             jql = f"project = {self.project_key} ORDER BY created DESC"
         
-        # Build the search request
-        search_data = {
-            "jql": jql,
-            "startAt": 0,
-            "maxResults": 50,  # Limit to 50 results by default
-            "fields": ["summary", "description", "status", "assignee", "created", "updated", "priority", "labels"]
-        }
+        fields = list(fields or SEARCH_FIELDS)
         
-        response = await self._make_request("POST", "search", search_data)
+        def page_request(start_at: int) -> Dict[str, Any]:
+            return {
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": SEARCH_PAGE_SIZE,
+                "fields": fields,
+                "fieldsByKeys": False,
+                "expand": []
+            }
         
-        if "error" in response:
-            log.error(f"Failed to search Jira issues: {response['error']}")
-        else:
-            issue_count = response.get("total", 0)
-            log.success(f"Successfully retrieved {issue_count} Jira issues")
-            
-        return response
+        response = await self._make_request("POST", "search", page_request(0))
+        if not response.ok:
+            log.error(f"Failed to search Jira issues: {response.error}")
+            return []
+        
+        issues = response.data.get("issues", [])
+        total = response.data.get("total", len(issues))
+        
+        # Jira may cap the page size below what was asked for, so step by what it actually returned
+        page_size = response.data.get("maxResults") or SEARCH_PAGE_SIZE
+        if total > page_size:
+            pages = await asyncio.gather(*[
+                self._make_request("POST", "search", page_request(start_at))
+                for start_at in range(page_size, total, page_size)
+            ])
+            for page in pages:
+                if not page.ok:
+                    log.error(f"Failed to fetch a page of Jira issues: {page.error}")
+                    continue
+                issues.extend(page.data.get("issues", []))
+        
+        log.success(f"Successfully retrieved {len(issues)} of {total} Jira issues")
+        return issues
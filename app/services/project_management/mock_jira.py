@@ -1,9 +1,52 @@
 from typing import Dict, Any, List, Optional
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from app.utils.logger import ColorLogger as log
 from .base import ProjectManagementTool
 
+# Static parts of mock issue keys and their browse URLs
+_KEY_PREFIX = "MOCK-"
+_BROWSE_URL_PREFIX = "https://mock-jira.example.com/browse/MOCK-"
+
+# Deleted issue records kept for reuse by later creates (bounds memory held after mass deletes)
+FREE_RECORDS_MAX = 1024
+
+# Bound once so timestamping and ID generation are a single global lookup and call each
+_now = datetime.now
+_uuid4 = uuid.uuid4
+
+@dataclass(slots=True)
+class MockIssue:
+    """A stored mock issue. Slots keep thousands of issues much smaller than per-issue dicts."""
+    id: str
+    key: str
+    title: str
+    description: str
+    priority: str
+    labels: List[str]
+    status: str
+    created_at: str
+    updated_at: str
+    url: str
+    description_locked: bool
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form returned through the ProjectManagementTool interface."""
+        return {
+            "id": self.id,
+            "key": self.key,
+            "title": self.title,
+            "description": self.description,
+            "priority": self.priority,
+            "labels": list(self.labels),
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "url": self.url,
+            "description_locked": self.description_locked
+        }
+
 class MockJiraProjectManagement(ProjectManagementTool):
     """
     Mock implementation of the Jira API for development and testing purposes.
@@ -11,9 +54,128 @@ class MockJiraProjectManagement(ProjectManagementTool):
     """
     
     def __init__(self):
-        # In-memory storage for mock issues
-        self._issues = {}
-        log.info("Initialized Mock Jira Project Management")
+        # In-memory storage for mock issues, by ID and by user-visible key (MOCK-XXXXXXXX)
+        self._issues: Dict[str, MockIssue] = {}
+        self._by_key: Dict[str, MockIssue] = {}
+        # Records of deleted issues, recycled on create instead of allocating new ones
+        self._free_records: List[MockIssue] = []
+        # Informational only; compiled out entirely under python -O / PYTHONOPTIMIZE
+        if __debug__:
+            log.info("Initialized Mock Jira Project Management")
+    
+    def _build_issue(self, title: str, description: str, priority: str, labels: Optional[List[str]],
+                     lock_description: bool, now_iso: str) -> MockIssue:
+        """Build a new mock issue with a fresh ID, created and updated at now_iso."""
+        # Generate a mock issue ID; the key uses the first 8 hex digits (no hyphen formatting needed)
+        issue_uuid = _uuid4()
+        issue_id = str(issue_uuid)
+        short_id = issue_uuid.hex[:8].upper()
+        
+        fields = (
+            issue_id,
+            _KEY_PREFIX + short_id,
+            title,
+            description,
+            priority,
+            labels or [],
+            "To Do",
+            now_iso,
+            now_iso,
+            _BROWSE_URL_PREFIX + short_id,
+            lock_description
+        )
+        if self._free_records:
+            # Records never leave the store (callers get dict copies), so a recycled one is safe to refill
+            issue = self._free_records.pop()
+            issue.__init__(*fields)
+            return issue
+        return MockIssue(*fields)
+    
+    def _lookup(self, issue_id: str) -> Optional[MockIssue]:
+        """Find a stored mock issue by ID or key, as the Jira REST API accepts either."""
+        issue = self._issues.get(issue_id)
+        return issue if issue is not None else self._by_key.get(issue_id)
+    
+    # Synchronous implementations; the store is plain in-memory data, so nothing here ever awaits.
+    # The async methods below are thin wrappers that satisfy the ProjectManagementTool interface.
+    
+    def _create_sync(self, title: str, description: str, priority: str,
+                     labels: Optional[List[str]], lock_description: bool) -> Dict[str, Any]:
+        """Create and store one mock issue."""
+        issue = self._build_issue(title, description, priority, labels, lock_description, _now().isoformat())
+        
+        # Store the issue
+        self._issues[issue.id] = issue
+        self._by_key[issue.key] = issue
+        
+        if __debug__:
+            log.info_fmt("Created mock Jira issue: %s - %s", issue.key, title)
+        
+        return issue.to_dict()
+    
+    def _create_many_sync(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create and store a batch of mock issues sharing one creation timestamp."""
+        now_iso = _now().isoformat()
+        issues = [
+            self._build_issue(
+                spec["title"],
+                spec["description"],
+                spec.get("priority", "Medium"),
+                spec.get("labels"),
+                spec.get("lock_description", True),
+                now_iso
+            )
+            for spec in specs
+        ]
+        
+        self._issues.update((issue.id, issue) for issue in issues)
+        self._by_key.update((issue.key, issue) for issue in issues)
+        
+        if __debug__:
+            log.info_fmt("Created %d mock Jira issues", len(issues))
+        
+        return [issue.to_dict() for issue in issues]
+    
+    def _update_status_sync(self, issue_id: str, status: str) -> Optional[Dict[str, Any]]:
+        """Set the status of a stored mock issue."""
+        issue = self._lookup(issue_id)
+        if issue is not None:
+            issue.status = status
+            issue.updated_at = _now().isoformat()
+            return issue.to_dict()
+        return None
+    
+    def _update_sync(self, issue_id: str, title: Optional[str], description: Optional[str],
+                     priority: Optional[str], labels: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Apply the given field changes to a stored mock issue."""
+        issue = self._lookup(issue_id)
+        if issue is not None:
+            if title is not None:
+                issue.title = title
+            if description is not None:
+                issue.description = description
+            if priority is not None:
+                issue.priority = priority
+            if labels is not None:
+                issue.labels = labels
+                
+            issue.updated_at = _now().isoformat()
+            return issue.to_dict()
+        return None
+    
+    def _delete_sync(self, issue_id: str) -> bool:
+        """Remove a mock issue from both indexes."""
+        issue = self._lookup(issue_id)
+        if issue is not None:
+            del self._issues[issue.id]
+            del self._by_key[issue.key]
+            if len(self._free_records) < FREE_RECORDS_MAX:
+                # Drop the large fields now rather than holding them until the record is reused
+                issue.title = issue.description = ""
+                issue.labels = []
+                self._free_records.append(issue)
+            return True
+        return False
     
     async def create_issue(self, title: str, description: str, 
                           priority: str = "Medium", 
@@ -31,30 +193,20 @@ class MockJiraProjectManagement(ProjectManagementTool):
         Returns:
             Dictionary with issue details
         """
-        # Generate a mock issue ID
-        issue_id = str(uuid.uuid4())
-        
-        # Create the issue object
-        issue = {
-            "id": issue_id,
-            "key": f"MOCK-{issue_id[:8].upper()}",
-            "title": title,
-            "description": description,
-            "priority": priority,
-            "labels": labels or [],
-            "status": "To Do",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "url": f"https://mock-jira.example.com/browse/MOCK-{issue_id[:8].upper()}",
-            "description_locked": lock_description
-        }
-        
-        # Store the issue
-        self._issues[issue_id] = issue
-        
-        log.info(f"Created mock Jira issue: {issue['key']} - {title}")
+        return self._create_sync(title, description, priority, labels, lock_description)
+    
+    async def create_issues(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several mock issues in one call, sharing a single creation timestamp.
         
-        return issue
+        Args:
+            specs: One dict of create_issue keyword arguments (title, description, priority,
+                labels, lock_description) per issue
+            
+        Returns:
+            List of issue dictionaries, in the same order as specs
+        """
+        return self._create_many_sync(specs)
     
     async def get_all_issues(self) -> List[Dict[str, Any]]:
         """
@@ -63,36 +215,33 @@ class MockJiraProjectManagement(ProjectManagementTool):
         Returns:
             List of issue dictionaries
         """
-        return list(self._issues.values())
+        return [issue.to_dict() for issue in self._issues.values()]
     
     async def get_issue(self, issue_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific mock issue.
         
         Args:
-            issue_id: ID of the issue to retrieve
+            issue_id: ID or key of the issue to retrieve
             
         Returns:
             Issue dictionary if found, None otherwise
         """
-        return self._issues.get(issue_id)
+        issue = self._lookup(issue_id)
+        return issue.to_dict() if issue is not None else None
     
     async def update_issue_status(self, issue_id: str, status: str) -> Optional[Dict[str, Any]]:
         """
         Update the status of a mock issue.
         
         Args:
-            issue_id: ID of the issue to update
+            issue_id: ID or key of the issue to update
             status: New status
             
         Returns:
             Updated issue dictionary if found, None otherwise
         """
-        if issue_id in self._issues:
-            self._issues[issue_id]["status"] = status
-            self._issues[issue_id]["updated_at"] = datetime.now().isoformat()
-            return self._issues[issue_id]
-        return None
+        return self._update_status_sync(issue_id, status)
     
     async def update_issue(self, issue_id: str, title: str = None, 
                           description: str = None, priority: str = None, 
@@ -101,7 +250,7 @@ class MockJiraProjectManagement(ProjectManagementTool):
         Update a mock issue.
         
         Args:
-            issue_id: ID of the issue to update
+            issue_id: ID or key of the issue to update
             title: New title (optional)
             description: New description (optional)
             priority: New priority (optional)
@@ -110,33 +259,16 @@ class MockJiraProjectManagement(ProjectManagementTool):
         Returns:
             Updated issue dictionary if found, None otherwise
         """
-        if issue_id in self._issues:
-            issue = self._issues[issue_id]
-            
-            if title is not None:
-                issue["title"] = title
-            if description is not None:
-                issue["description"] = description
-            if priority is not None:
-                issue["priority"] = priority
-            if labels is not None:
-                issue["labels"] = labels
-                
-            issue["updated_at"] = datetime.now().isoformat()
-            return issue
-        return None
+        return self._update_sync(issue_id, title, description, priority, labels)
     
     async def delete_issue(self, issue_id: str) -> bool:
         """
         Delete a mock issue.
         
         Args:
-            issue_id: ID of the issue to delete
+            issue_id: ID or key of the issue to delete
             
         Returns:
             True if deleted, False if not found
         """
-        if issue_id in self._issues:
-            del self._issues[issue_id]
-            return True
-        return False
+        return self._delete_sync(issue_id)
\ No newline at end of file
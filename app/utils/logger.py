@@ -1,10 +1,53 @@
 import logging
-from datetime import datetime
-from typing import Optional
+import sys
+import time
+from types import MappingProxyType
+from typing import Final, Mapping, Optional, Tuple
+from app.core.config import settings
+
+# Messages below this level are dropped before any formatting or writing
+_MIN_LEVEL = logging.getLevelName(settings.LOG_LEVEL)
+if not isinstance(_MIN_LEVEL, int):
+    _MIN_LEVEL = logging.INFO
+
+# (epoch second, formatted HH:MM:SS) of the last timestamp, swapped as one tuple so threads never see a torn pair
+_last_timestamp = (0, '')
+
+
+def _timestamp(now: int) -> str:
+    """Local time of an epoch second as HH:MM:SS, only reformatted when the second changes."""
+    global _last_timestamp
+    second, formatted = _last_timestamp
+    if now != second:
+        formatted = time.strftime('%H:%M:%S', time.localtime(now))
+        _last_timestamp = (now, formatted)
+    return formatted
+
+
+class _ColorFormatter(logging.Formatter):
+    """Renders records as "{color}{indent}{emoji} [HH:MM:SS] {message}{reset}"."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return (
+            f"{record.color}{record.indent_str}{record.emoji} "
+            f"[{_timestamp(int(record.created))}] {record.getMessage()}{ColorLogger._RESET}"
+        )
+
+
+# ColorLogger writes through a standard logger, so level filtering, handler locking (lines from
+# worker threads never interleave) and any extra handlers come from the logging module
+_logger = logging.getLogger("obligation_to_jira")
+_logger.setLevel(_MIN_LEVEL)
+_logger.propagate = False
+if not _logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(_ColorFormatter())
+    _logger.addHandler(_handler)
+
 
 class ColorLogger:
-    # ANSI escape codes for colors
-    COLORS = {
+    # ANSI escape codes for colors (read-only)
+    COLORS: Final[Mapping[str, str]] = MappingProxyType({
         'GREEN': '\033[92m',
         'YELLOW': '\033[93m',
         'RED': '\033[91m',
@@ -12,10 +55,10 @@ class ColorLogger:
         'PURPLE': '\033[95m',
         'CYAN': '\033[96m',
         'RESET': '\033[0m'
-    }
+    })
 
-    # Emojis for different log types
-    EMOJIS = {
+    # Emojis for different log types (read-only)
+    EMOJIS: Final[Mapping[str, str]] = MappingProxyType({
         'success': '✅',
         'info': 'ℹ️ ',
         'warning': '⚠️ ',
@@ -26,45 +69,92 @@ class ColorLogger:
         'obligation': '📝',
         'start': '🚀',
         'complete': '🏁',
-        'retry': '🔄'
-    }
+        'retry': '🔄',
+        'debug': '🔍'
+    })
+
+    # (color code, emoji, level) per log method, resolved once at import instead of on every call
+    _PREFIX: Final[Mapping[str, Tuple[str, str, int]]] = MappingProxyType({
+        'success': (COLORS['GREEN'], EMOJIS['success'], logging.INFO),
+        'info': (COLORS['BLUE'], EMOJIS['info'], logging.INFO),
+        'warning': (COLORS['YELLOW'], EMOJIS['warning'], logging.WARNING),
+        'error': (COLORS['RED'], EMOJIS['error'], logging.ERROR),
+        'processing': (COLORS['CYAN'], EMOJIS['processing'], logging.INFO),
+        'chunk': (COLORS['PURPLE'], EMOJIS['chunk'], logging.INFO),
+        'party': (COLORS['GREEN'], EMOJIS['party'], logging.INFO),
+        'obligation': (COLORS['BLUE'], EMOJIS['obligation'], logging.INFO),
+        'debug': (COLORS['CYAN'], EMOJIS['debug'], logging.DEBUG)
+    })
+    _RESET = COLORS['RESET']
+
+    # Indent strings for the usual nesting depths
+    _INDENTS = tuple('  ' * i for i in range(16))
+
+    @staticmethod
+    def _emit(levelno: int, msg: str, color_code: str, emoji_icon: str, indent: int, args: tuple = ()) -> None:
+        indent_str = ColorLogger._INDENTS[indent] if indent < 16 else '  ' * indent
+        _logger.log(levelno, msg, *args, extra={'color': color_code, 'emoji': emoji_icon, 'indent_str': indent_str})
 
     @staticmethod
     def log(msg: str, color: str = 'RESET', emoji: str = 'info', indent: int = 0) -> None:
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        indent_str = '  ' * indent
+        if not _logger.isEnabledFor(logging.INFO):
+            return
         emoji_icon = ColorLogger.EMOJIS.get(emoji, '')
-        color_code = ColorLogger.COLORS.get(color, ColorLogger.COLORS['RESET'])
-        print(f"{color_code}{indent_str}{emoji_icon} [{timestamp}] {msg}{ColorLogger.COLORS['RESET']}")
+        color_code = ColorLogger.COLORS.get(color, ColorLogger._RESET)
+        ColorLogger._emit(logging.INFO, msg, color_code, emoji_icon, indent)
+
+    @staticmethod
+    def _log_fast(level: str, msg: str, indent: int = 0) -> None:
+        color_code, emoji_icon, levelno = ColorLogger._PREFIX[level]
+        if not _logger.isEnabledFor(levelno):
+            return
+        ColorLogger._emit(levelno, msg, color_code, emoji_icon, indent)
+
+    @staticmethod
+    def _log_fmt(level: str, fmt: str, args: tuple, indent: int = 0) -> None:
+        color_code, emoji_icon, levelno = ColorLogger._PREFIX[level]
+        if not _logger.isEnabledFor(levelno):
+            return
+        ColorLogger._emit(levelno, fmt, color_code, emoji_icon, indent, args)
+
+    @staticmethod
+    def info_fmt(fmt: str, *args, indent: int = 0) -> None:
+        """Like info(), but fmt % args is only evaluated when the message will actually be written."""
+        ColorLogger._log_fmt('info', fmt, args, indent)
+
+    @staticmethod
+    def debug_fmt(fmt: str, *args, indent: int = 0) -> None:
+        """DEBUG-level counterpart of info_fmt(); a no-op unless LOG_LEVEL is DEBUG."""
+        ColorLogger._log_fmt('debug', fmt, args, indent)
 
     @staticmethod
     def success(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'GREEN', 'success', indent)
+        ColorLogger._log_fast('success', msg, indent)
 
     @staticmethod
     def info(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'BLUE', 'info', indent)
+        ColorLogger._log_fast('info', msg, indent)
 
     @staticmethod
     def warning(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'YELLOW', 'warning', indent)
+        ColorLogger._log_fast('warning', msg, indent)
 
     @staticmethod
     def error(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'RED', 'error', indent)
+        ColorLogger._log_fast('error', msg, indent)
 
     @staticmethod
     def processing(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'CYAN', 'processing', indent)
+        ColorLogger._log_fast('processing', msg, indent)
 
     @staticmethod
     def chunk(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'PURPLE', 'chunk', indent)
+        ColorLogger._log_fast('chunk', msg, indent)
 
     @staticmethod
     def party(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'GREEN', 'party', indent)
+        ColorLogger._log_fast('party', msg, indent)
 
     @staticmethod
     def obligation(msg: str, indent: int = 0) -> None:
-        ColorLogger.log(msg, 'BLUE', 'obligation', indent)
+        ColorLogger._log_fast('obligation', msg, indent)
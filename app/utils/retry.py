@@ -0,0 +1,16 @@
+import random
+from typing import Mapping
+
+
+def retry_delay(headers: Mapping[str, str], attempt: int, max_delay: float = 60.0) -> float:
+    """
+    Compute how long to wait before retrying a rate-limited request.
+    Honors the Retry-After header when present, otherwise uses exponential backoff with jitter.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), max_delay) + random.uniform(0, 0.5)
+        except ValueError:
+            pass
+    return min(2 ** attempt + random.random(), max_delay)